@@ -19,7 +19,7 @@ class CChorusAutoBranchCreator:
         self.project_root = project_root
         self.backlog_path = project_root / "BACKLOG.md"
         self.branch_log_path = project_root / ".claude" / "auto-branch-log.json"
-        self.session_trigger_path = project_root / ".claude" / "pending-agent-invocations.json"
+        self.session_trigger_path = project_root / ".claude" / "pending-agent-invocations.jsonl"
         
         # Ensure .claude directory exists
         (project_root / ".claude").mkdir(exist_ok=True)
@@ -312,14 +312,6 @@ class CChorusAutoBranchCreator:
     def _create_gitops_invocation(self, trigger: Dict):
         """Create a GitOps agent invocation for the new branch."""
         try:
-            invocations = []
-            if self.session_trigger_path.exists():
-                try:
-                    with open(self.session_trigger_path, 'r') as f:
-                        invocations = json.load(f)
-                except:
-                    invocations = []
-            
             new_invocation = {
                 "agent": "gitops-workflow-manager",
                 "timestamp": datetime.now().strftime('%I:%M:%S%p').lower(),
@@ -334,11 +326,19 @@ class CChorusAutoBranchCreator:
                 }
             }
             
-            invocations.append(new_invocation)
-            
-            with open(self.session_trigger_path, 'w') as f:
-                json.dump(invocations, f, indent=2)
-            
+            # JSON Lines queue shared with the watchers and sync command:
+            # one flock-guarded append instead of rewriting the array,
+            # which raced the other writers
+            import fcntl
+            line = (json.dumps(new_invocation, separators=(',', ':')) + '\n').encode()
+            fd = os.open(self.session_trigger_path,
+                         os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+                os.write(fd, line)
+            finally:
+                os.close(fd)
+
             print(f"🤖 Created GitOps agent invocation for branch management")
             
         except Exception as e:
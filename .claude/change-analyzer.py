@@ -1,14 +1,12 @@
-#!/usr/bin/env python3
+#!/usr/bin/env -S python3 -S
 """
 CChorus Change Analyzer
 Standalone utility for analyzing file changes and recommending micro-agent routing.
 """
 
-import os
+import io
 import sys
 import json
-import hashlib
-from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
 from dataclasses import dataclass, asdict
@@ -175,42 +173,39 @@ class ChangeAnalyzer:
     
     def generate_report(self, analysis: ChangeAnalysis) -> str:
         """Generate a human-readable analysis report."""
-        report = []
-        report.append("🧠 CChorus Change Analysis Report")
-        report.append("=" * 40)
-        report.append(f"📊 Total Changes: {analysis.total_changes}")
-        report.append("")
-        
+        # Stream into one buffer instead of growing a list and joining
+        buf = io.StringIO()
+
+        buf.write("🧠 CChorus Change Analysis Report\n")
+        buf.write("=" * 40 + "\n")
+        buf.write(f"📊 Total Changes: {analysis.total_changes}\n\n")
+
         # File types breakdown
-        report.append("📁 File Types:")
-        for file_type, count in analysis.file_types.items():
-            report.append(f"  • {file_type}: {count} files")
-        report.append("")
-        
+        buf.write("📁 File Types:\n")
+        buf.writelines(f"  • {file_type}: {count} files\n"
+                       for file_type, count in analysis.file_types.items())
+
         # Priority breakdown
-        report.append("⚡ Priority Levels:")
-        for priority, count in analysis.priorities.items():
-            report.append(f"  • {priority}: {count} files")
-        report.append("")
-        
+        buf.write("\n⚡ Priority Levels:\n")
+        buf.writelines(f"  • {priority}: {count} files\n"
+                       for priority, count in analysis.priorities.items())
+
         # Agent recommendations
-        report.append("🤖 Recommended Agents:")
-        for agent, files in analysis.agent_recommendations.items():
-            report.append(f"  • {agent}: {len(files)} files")
-        report.append("")
-        
+        buf.write("\n🤖 Recommended Agents:\n")
+        buf.writelines(f"  • {agent}: {len(files)} files\n"
+                       for agent, files in analysis.agent_recommendations.items())
+
         # Workflow suggestion
-        report.append("🚀 Suggested Workflow:")
-        report.append(f"  {analysis.workflow_suggestion}")
-        report.append("")
-        
+        buf.write("\n🚀 Suggested Workflow:\n")
+        buf.write(f"  {analysis.workflow_suggestion}\n\n")
+
         # Performance estimates
-        report.append("📈 Performance Estimates:")
-        report.append(f"  • Estimated tokens: ~{analysis.estimated_tokens:,}")
-        report.append(f"  • Parallel execution: {'Yes' if analysis.parallel_capable else 'No'}")
-        report.append(f"  • Expected time: {self._estimate_time(analysis)} seconds")
-        
-        return "\n".join(report)
+        buf.write("📈 Performance Estimates:\n")
+        buf.write(f"  • Estimated tokens: ~{analysis.estimated_tokens:,}\n")
+        buf.write(f"  • Parallel execution: {'Yes' if analysis.parallel_capable else 'No'}\n")
+        buf.write(f"  • Expected time: {self._estimate_time(analysis)} seconds")
+
+        return buf.getvalue()
     
     def _estimate_time(self, analysis: ChangeAnalysis) -> str:
         """Estimate execution time based on analysis."""
@@ -239,13 +234,15 @@ def main():
     if sys.argv[1] == '--from-trigger':
         # Read from trigger file
         trigger_file = project_root / ".claude" / "doc-update-needed.trigger"
-        if not trigger_file.exists():
+        # EAFP: one open attempt instead of exists()+open, which costs an
+        # extra stat and races the watcher replacing the trigger
+        try:
+            with open(trigger_file, 'rb') as f:
+                trigger_data = json.loads(f.read())
+        except FileNotFoundError:
             print("❌ No trigger file found")
             sys.exit(1)
-        
-        with open(trigger_file) as f:
-            trigger_data = json.load(f)
-        
+
         file_paths = trigger_data.get('changes_detected', [])
     else:
         # Use command line arguments
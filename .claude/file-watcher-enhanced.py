@@ -17,6 +17,23 @@ from dataclasses import dataclass, asdict
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
 
+# orjson serializes and parses in C several times faster than stdlib json;
+# fall back to the stdlib so the watcher runs without the dependency.
+try:
+    import orjson
+
+    def _loads(data):
+        return orjson.loads(data)
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    def _loads(data):
+        return json.loads(data)
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode()
+
 @dataclass
 class FileChange:
     """Represents a detected file change with metadata."""
@@ -35,8 +52,19 @@ class FileChange:
 class SmartChangeAnalyzer:
     """Analyzes file changes and determines appropriate micro-agent routing."""
     
-    def __init__(self):
+    def __init__(self, cache_file: Optional[Path] = None):
+        self.cache_file = cache_file
         self.file_hashes: Dict[str, str] = {}
+        self.file_stats: Dict[str, tuple] = {}
+        if cache_file is not None:
+            try:
+                with open(cache_file, 'rb') as f:
+                    cached = _loads(f.read())
+                self.file_hashes = cached.get('hashes', {})
+                self.file_stats = {path: tuple(sig)
+                                   for path, sig in cached.get('stats', {}).items()}
+            except (FileNotFoundError, ValueError):
+                pass
         self.agent_routing = {
             'component': ['component-documenter', 'readme-updater'],
             'api': ['api-documenter', 'readme-updater'],
@@ -56,14 +84,24 @@ class SmartChangeAnalyzer:
         content_hash = None
         if path.exists() and path.is_file():
             try:
+                # Stat fast path: if (mtime_ns, size) match the last sighting
+                # the content cannot have changed, so a duplicate event is
+                # dropped without reading or hashing the file
+                st = path.stat()
+                stat_sig = (st.st_mtime_ns, st.st_size)
+                if self.file_stats.get(file_path) == stat_sig:
+                    return None
+
                 content = path.read_bytes()
                 content_hash = hashlib.md5(content).hexdigest()
-                
+
                 # Skip if content unchanged
                 if file_path in self.file_hashes and self.file_hashes[file_path] == content_hash:
+                    self.file_stats[file_path] = stat_sig
                     return None
-                
+
                 self.file_hashes[file_path] = content_hash
+                self.file_stats[file_path] = stat_sig
             except Exception:
                 pass
         
@@ -85,6 +123,20 @@ class SmartChangeAnalyzer:
             suggested_agents=suggested_agents
         )
     
+    def save_cache(self):
+        """Persist the hash/stat cache so a restarted watcher does not
+        re-hash (and re-trigger on) files unchanged since the last run."""
+        if self.cache_file is None:
+            return
+        try:
+            tmp = self.cache_file.with_suffix('.json.tmp')
+            with open(tmp, 'wb') as f:
+                f.write(_dumps({'hashes': self.file_hashes,
+                                'stats': self.file_stats}))
+            os.replace(tmp, self.cache_file)
+        except Exception as e:
+            print(f"⚠️  Could not save hash cache: {e}")
+
     def _classify_file(self, path: Path) -> Optional[str]:
         """Classify file type for routing purposes."""
         path_str = str(path)
@@ -142,9 +194,10 @@ class CChorusEnhancedWatcher(FileSystemEventHandler):
     
     def __init__(self, project_root: Path):
         self.project_root = project_root
-        self.analyzer = SmartChangeAnalyzer()
+        self.analyzer = SmartChangeAnalyzer(
+            cache_file=project_root / ".claude" / ".file-hash-cache.json")
         self.trigger_file = project_root / ".claude" / "doc-update-needed.trigger"
-        self.pending_invocations_file = project_root / ".claude" / "pending-agent-invocations.json"
+        self.pending_invocations_file = project_root / ".claude" / "pending-agent-invocations.jsonl"
         self.changes_log_file = project_root / ".claude" / "file-changes.log"
         
         self.last_trigger_time = 0
@@ -205,8 +258,8 @@ class CChorusEnhancedWatcher(FileSystemEventHandler):
                 "change": change.change_type
             }
             
-            with open(self.changes_log_file, 'a') as f:
-                f.write(json.dumps(log_entry) + '\n')
+            with open(self.changes_log_file, 'ab') as f:
+                f.write(_dumps(log_entry) + b'\n')
         except Exception as e:
             print(f"⚠️  Could not log change: {e}")
     
@@ -220,16 +273,22 @@ class CChorusEnhancedWatcher(FileSystemEventHandler):
         try:
             # Group changes by suggested agents
             agent_work = self._group_changes_by_agents()
-            
+
+            # Batch boundary: checkpoint the analyzer's hash cache so a
+            # watcher restart picks up where this run left off
+            self.analyzer.save_cache()
+
             # Try enhanced micro-agent workflow first
             if self._try_microagent_workflow(agent_work):
                 print("✅ Successfully triggered /microagent workflow")
                 self.pending_changes.clear()
                 return
-            
-            # Fallback to legacy trigger files
-            self._create_enhanced_trigger_files(agent_work)
-            self._update_dashboard_status()
+
+            # Fallback to legacy trigger files; summarize the batch once and
+            # share it across the writers instead of re-scanning per field
+            summary = self._summarize_pending_changes()
+            self._create_enhanced_trigger_files(agent_work, summary)
+            self._update_dashboard_status(summary)
             
             print("✅ Enhanced trigger files created with agent routing")
             self.pending_changes.clear()
@@ -237,6 +296,35 @@ class CChorusEnhancedWatcher(FileSystemEventHandler):
         except Exception as e:
             print(f"❌ Error processing changes: {e}")
     
+    def _summarize_pending_changes(self) -> Dict:
+        """Collect paths, type/priority sets, agents, and batch priority in one pass."""
+        paths = []
+        file_types = {}
+        priorities = {}
+        agents = {}
+
+        for change in self.pending_changes:
+            paths.append(change.path)
+            file_types[change.file_type] = None
+            priorities[change.priority] = None
+            for agent in change.suggested_agents:
+                agents[agent] = None
+
+        if 'high' in priorities:
+            batch_priority = 'high'
+        elif 'medium' in priorities:
+            batch_priority = 'medium'
+        else:
+            batch_priority = 'low'
+
+        return {
+            "paths": paths,
+            "file_types": list(file_types),
+            "priorities": list(priorities),
+            "suggested_agents": list(agents),
+            "batch_priority": batch_priority
+        }
+
     def _group_changes_by_agents(self) -> Dict[str, List[FileChange]]:
         """Group changes by suggested micro-agents."""
         agent_work = {}
@@ -253,12 +341,13 @@ class CChorusEnhancedWatcher(FileSystemEventHandler):
         """Try to trigger enhanced /microagent workflow."""
         try:
             # Check if claude command is available
-            result = subprocess.run(['which', 'claude'], 
-                                  capture_output=True, text=True)
+            # Bytes mode: decode only the output that is actually kept
+            result = subprocess.run(['which', 'claude'],
+                                  capture_output=True)
             if result.returncode != 0:
                 return False
-            
-            claude_path = result.stdout.strip()
+
+            claude_path = result.stdout.decode('utf-8', 'replace').strip()
             
             # Build microagent command with context
             context_summary = self._build_context_summary(agent_work)
@@ -268,14 +357,14 @@ class CChorusEnhancedWatcher(FileSystemEventHandler):
                 claude_path, 
                 '/microagent',
                 '--context', context_summary
-            ], capture_output=True, text=True, cwd=self.project_root, timeout=180)
-            
+            ], capture_output=True, cwd=self.project_root, timeout=180)
+
             if result.returncode == 0:
                 print("✅ /microagent workflow executed successfully")
                 print("📋 Smart agent routing completed")
                 return True
             else:
-                print(f"⚠️  /microagent workflow failed: {result.stderr}")
+                print(f"⚠️  /microagent workflow failed: {result.stderr.decode('utf-8', 'replace')}")
                 return False
                 
         except subprocess.TimeoutExpired:
@@ -299,88 +388,74 @@ class CChorusEnhancedWatcher(FileSystemEventHandler):
         
         return "; ".join(summary_parts)
     
-    def _create_enhanced_trigger_files(self, agent_work: Dict[str, List[FileChange]]):
+    def _create_enhanced_trigger_files(self, agent_work: Dict[str, List[FileChange]], summary: Dict):
         """Create enhanced trigger files with micro-agent routing."""
         # Enhanced main trigger file
         trigger_content = {
             "timestamp": datetime.now().isoformat(),
             "reason": "Auto-triggered by enhanced file watcher",
-            "changes_detected": [change.path for change in self.pending_changes],
-            "change_count": len(self.pending_changes),
+            "changes_detected": summary["paths"],
+            "change_count": len(summary["paths"]),
             "workflow": "micro-agent routing -> parallel execution",
             "agent_routing": agent_work,
             "smart_analysis": {
-                "file_types": list(set(change.file_type for change in self.pending_changes)),
-                "priorities": list(set(change.priority for change in self.pending_changes)),
+                "file_types": summary["file_types"],
+                "priorities": summary["priorities"],
                 "suggested_workflow": "/microagent for smart routing"
             },
             "instructions": "Run: claude /microagent for intelligent agent routing",
-            "priority": self._determine_batch_priority()
+            "priority": summary["batch_priority"]
         }
-        
-        with open(self.trigger_file, 'w') as f:
-            json.dump(trigger_content, f, indent=2)
-        
+
+        # Write to a tempfile and rename: os.replace is atomic on POSIX, so
+        # a reader can never observe a half-written trigger
+        tmp = self.trigger_file.with_suffix('.trigger.tmp')
+        with open(tmp, 'wb') as f:
+            f.write(_dumps(trigger_content))
+        os.replace(tmp, self.trigger_file)
+
         # Enhanced agent invocations with routing
-        self._create_enhanced_agent_invocations(agent_work)
+        self._create_enhanced_agent_invocations(agent_work, summary)
     
-    def _create_enhanced_agent_invocations(self, agent_work: Dict[str, List[FileChange]]):
+    def _create_enhanced_agent_invocations(self, agent_work: Dict[str, List[FileChange]], summary: Dict):
         """Create enhanced agent invocations with smart routing."""
-        invocations = []
-        if self.pending_invocations_file.exists():
-            try:
-                with open(self.pending_invocations_file, 'r') as f:
-                    invocations = json.load(f)
-            except:
-                invocations = []
-        
         # Create invocation for file-change-analyzer to coordinate
         coordinator_invocation = {
             "agent": "file-change-analyzer",
             "timestamp": datetime.now().isoformat(),
             "trigger": "enhanced-file-watcher",
             "prompt": f"Smart routing: Analyze {len(self.pending_changes)} changes and coordinate micro-agents",
-            "priority": self._determine_batch_priority(),
+            "priority": summary["batch_priority"],
             "auto_triggered": True,
             "agent_routing": {agent: [asdict(change) for change in changes] 
                            for agent, changes in agent_work.items()},
             "workflow_type": "micro-agent-coordination"
         }
         
-        invocations.append(coordinator_invocation)
-        
-        with open(self.pending_invocations_file, 'w') as f:
-            json.dump(invocations, f, indent=2)
-    
-    def _determine_batch_priority(self) -> str:
-        """Determine overall priority for change batch."""
-        priorities = [change.priority for change in self.pending_changes]
-        if 'high' in priorities:
-            return 'high'
-        elif 'medium' in priorities:
-            return 'medium'
-        return 'low'
+        # JSON Lines queue: one atomic O_APPEND write per invocation instead
+        # of re-reading and rewriting the whole array each trigger
+        with open(self.pending_invocations_file, 'ab') as f:
+            f.write(_dumps(coordinator_invocation) + b'\n')
     
-    def _update_dashboard_status(self):
+    def _update_dashboard_status(self, summary: Dict):
         """Update dashboard status file for real-time monitoring."""
         dashboard_status_file = self.project_root / ".claude" / "dashboard-status.json"
-        
+
         status = {
             "timestamp": datetime.now().isoformat(),
             "watcher_active": True,
-            "changes_processed": len(self.pending_changes),
+            "changes_processed": len(summary["paths"]),
             "agent_routing_enabled": True,
             "last_analysis": {
-                "file_types": list(set(change.file_type for change in self.pending_changes)),
-                "priorities": list(set(change.priority for change in self.pending_changes)),
-                "suggested_agents": list(set(agent for change in self.pending_changes 
-                                           for agent in change.suggested_agents))
+                "file_types": summary["file_types"],
+                "priorities": summary["priorities"],
+                "suggested_agents": summary["suggested_agents"]
             }
         }
         
         try:
-            with open(dashboard_status_file, 'w') as f:
-                json.dump(status, f, indent=2)
+            with open(dashboard_status_file, 'wb') as f:
+                f.write(_dumps(status))
         except Exception as e:
             print(f"⚠️  Could not update dashboard status: {e}")
 
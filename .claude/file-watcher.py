@@ -5,9 +5,11 @@ Monitors source files and automatically triggers documentation updates when chan
 """
 
 import os
+import re
 import sys
 import time
 import json
+import shutil
 import subprocess
 from datetime import datetime
 from pathlib import Path
@@ -15,15 +17,44 @@ from typing import Set, Dict, List
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
 
+# orjson serializes and parses in C several times faster than stdlib json;
+# fall back to the stdlib so the watcher runs without the dependency.
+try:
+    import orjson
+
+    def _loads(data):
+        return orjson.loads(data)
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    def _loads(data):
+        return json.loads(data)
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode()
+
+# Every monitored path pattern as one compiled alternation: a single
+# C-level scan per event instead of seven Python substring checks.
+_DOC_TRIGGER_RE = re.compile(
+    r'src/(?:components|services|utils)/'
+    r'|(?:\A|/)(?:server\.js|CLAUDE\.md)\Z'
+    r'|\.claude/(?:agents|commands)/'
+)
+
 class CChorusDocumentationWatcher(FileSystemEventHandler):
     def __init__(self, project_root: Path):
         self.project_root = project_root
         self.trigger_file = project_root / ".claude" / "doc-update-needed.trigger"
-        self.pending_invocations_file = project_root / ".claude" / "pending-agent-invocations.json"
+        self.pending_invocations_file = project_root / ".claude" / "pending-agent-invocations.jsonl"
         self.last_trigger_time = 0
         self.debounce_seconds = 30  # Wait 30 seconds between triggers
         self.pending_changes: Set[str] = set()
-        
+        # Resolve the CLI once at startup: shutil.which is a pure-Python
+        # PATH scan, so the common "claude not installed" case never costs
+        # a fork+exec per trigger
+        self.claude_path = shutil.which('claude')
+
         # Ensure .claude directory exists
         (project_root / ".claude").mkdir(exist_ok=True)
         
@@ -33,18 +64,15 @@ class CChorusDocumentationWatcher(FileSystemEventHandler):
     
     def should_trigger_docs(self, file_path: str) -> bool:
         """Determine if a file change should trigger documentation updates."""
-        path = Path(file_path)
-        
+        # Cheap gate first: events outside src/ and .claude/ can only match
+        # on the two special filenames, so the common non-doc save never
+        # reaches the regex.
+        if ('src/' not in file_path and '.claude/' not in file_path
+                and not file_path.endswith(('server.js', 'CLAUDE.md'))):
+            return False
+
         # Monitor key source directories and files
-        return (
-            'src/components/' in str(path) or
-            'src/services/' in str(path) or
-            'src/utils/' in str(path) or
-            path.name == 'server.js' or
-            path.name == 'CLAUDE.md' or
-            '.claude/agents/' in str(path) or
-            '.claude/commands/' in str(path)
-        )
+        return _DOC_TRIGGER_RE.search(file_path) is not None
     
     def on_modified(self, event):
         if event.is_directory:
@@ -95,21 +123,17 @@ class CChorusDocumentationWatcher(FileSystemEventHandler):
         """Try to trigger documentation update via Claude CLI."""
         try:
             # Check if claude command is available
-            result = subprocess.run(['which', 'claude'], 
-                                  capture_output=True, 
-                                  text=True)
-            
-            if result.returncode != 0:
+            claude_path = self.claude_path
+            if not claude_path:
                 print("⚠️  Claude CLI not found in PATH")
                 return False
-            
-            claude_path = result.stdout.strip()
+
             print(f"🔍 Found Claude CLI at: {claude_path}")
             
-            # Check if there's an active Claude session
+            # Check if there's an active Claude session (bytes mode: only
+            # the exit status matters, so nothing is decoded)
             session_check = subprocess.run([claude_path, '--version'],
                                          capture_output=True,
-                                         text=True,
                                          timeout=5)
             
             if session_check.returncode != 0:
@@ -122,13 +146,13 @@ class CChorusDocumentationWatcher(FileSystemEventHandler):
                 claude_path, 
                 '@documentation-manager', 
                 'update docs for recent changes detected by file watcher'
-            ], capture_output=True, text=True, cwd=self.project_root, timeout=60)
-            
+            ], capture_output=True, cwd=self.project_root, timeout=60)
+
             if result.returncode == 0:
                 print("✅ Documentation agent invoked successfully")
                 return True
             else:
-                print(f"⚠️  Documentation agent invocation failed: {result.stderr}")
+                print(f"⚠️  Documentation agent invocation failed: {result.stderr.decode('utf-8', 'replace')}")
                 return False
                 
         except subprocess.TimeoutExpired:
@@ -140,9 +164,14 @@ class CChorusDocumentationWatcher(FileSystemEventHandler):
     
     def create_trigger_files(self):
         """Create trigger files for documentation updates."""
+        # One timestamp for the whole trigger batch: the trigger file and
+        # the invocation record must correlate downstream, and the two
+        # strftime calls could land on different seconds
+        timestamp = datetime.now().strftime('%I:%M:%S%p').lower()
+
         # Create main trigger file
         trigger_content = {
-            "timestamp": datetime.now().strftime('%I:%M:%S%p').lower(),
+            "timestamp": timestamp,
             "reason": "Auto-triggered by file watcher",
             "changes_detected": list(self.pending_changes),
             "change_count": len(self.pending_changes),
@@ -151,27 +180,33 @@ class CChorusDocumentationWatcher(FileSystemEventHandler):
             "priority": self.determine_priority()
         }
         
-        with open(self.trigger_file, 'w') as f:
-            json.dump(trigger_content, f, indent=2)
-        
+        # Write to a tempfile and rename: os.replace is atomic on POSIX, so
+        # a reader can never observe a half-written trigger
+        tmp = self.trigger_file.with_suffix('.trigger.tmp')
+        with open(tmp, 'wb', buffering=65536) as f:
+            f.write(_dumps(trigger_content))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.trigger_file)
+
         print(f"📋 Created trigger file: {self.trigger_file}")
-        
+
         # Create agent invocation file
-        self.create_agent_invocation()
-    
-    def create_agent_invocation(self):
+        self.create_agent_invocation(timestamp)
+
+        # One directory fsync covers both the trigger rename and the queue
+        # append, so a crash can't leave the trigger without its queue entry
+        dir_fd = os.open(self.trigger_file.parent, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+    def create_agent_invocation(self, timestamp: str):
         """Create agent invocation trigger."""
-        invocations = []
-        if self.pending_invocations_file.exists():
-            try:
-                with open(self.pending_invocations_file, 'r') as f:
-                    invocations = json.load(f)
-            except:
-                invocations = []
-        
         new_invocation = {
             "agent": "documentation-manager",
-            "timestamp": datetime.now().strftime('%I:%M:%S%p').lower(),
+            "timestamp": timestamp,
             "trigger": "file-watcher-auto",
             "prompt": f"Auto-triggered: Update documentation for {len(self.pending_changes)} file changes detected by real-time watcher",
             "priority": self.determine_priority(),
@@ -179,11 +214,13 @@ class CChorusDocumentationWatcher(FileSystemEventHandler):
             "files_changed": list(self.pending_changes)
         }
         
-        invocations.append(new_invocation)
-        
-        with open(self.pending_invocations_file, 'w') as f:
-            json.dump(invocations, f, indent=2)
-        
+        # JSON Lines queue: one atomic O_APPEND write per invocation instead
+        # of re-reading and rewriting the whole array each trigger
+        with open(self.pending_invocations_file, 'ab') as f:
+            f.write(_dumps(new_invocation) + b'\n')
+            f.flush()
+            os.fsync(f.fileno())
+
         print(f"🤖 Created agent invocation: {self.pending_invocations_file}")
     
     def determine_priority(self) -> str:
@@ -220,7 +257,7 @@ class CChorusDocumentationWatcher(FileSystemEventHandler):
 
 **Trigger Files**: 
 - `.claude/doc-update-needed.trigger`
-- `.claude/pending-agent-invocations.json`
+- `.claude/pending-agent-invocations.jsonl`
 
 ---
 
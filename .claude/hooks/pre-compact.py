@@ -8,11 +8,288 @@ Enhanced to actively invoke /docgit workflow when changes are detected.
 import sys
 import json
 import os
+import re
+import string
 import subprocess
+from collections import Counter
+from functools import cached_property, lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
 
+# orjson parses and serializes several times faster than stdlib json, and the
+# session file grows with every recorded operation, so the swap pays off on
+# every hook run. Fall back to stdlib json so the hook works without the dep.
+try:
+    import orjson
+
+    def _loads(data):
+        return orjson.loads(data)
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    def _dumps_line(obj) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    def _loads(data):
+        return json.loads(data)
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode()
+
+    def _dumps_line(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+# The markdown skeletons below are fixed at author time - only the ~20
+# substitutions vary per session. Precomputing them as string.Template
+# objects means each invocation does a single substitute() pass instead of
+# rebuilding the whole document from an f-string.
+_SESSION_DOC_TMPL = string.Template("""# CChorus Development Session Summary
+
+**Session ID**: $session_id
+**Date**: $date
+**Trigger**: $trigger compaction
+**Project**: CChorus - Claude Code Resource Management Platform
+$instructions_line
+
+## 🎯 Session Focus
+
+**Development Area**: $development_focus
+**Component Work**: $component_work
+**Agent Workflow**: Documentation → GitOps sequence $workflow_status
+
+## 📊 Session Metrics
+
+- **Duration**: $duration
+- **Operations**: $operations_count tool uses
+- **Files Changed**: $files_changed
+- **Component Files**: $component_files
+- **API Endpoints**: $api_changes
+- **Documentation Files**: $doc_files
+
+## 🚀 CChorus Achievements
+
+$achievements
+
+## 🔧 Code Changes Analysis
+
+$code_changes
+
+## 🛠️ Key Operations Timeline
+
+$timeline
+
+## 📋 CChorus-Specific Context
+
+**Resource Library Development**: $resource_library_work
+**Assignment Manager Work**: $assignment_manager_work
+**Agent System Changes**: $agent_system_work
+**UI Components Modified**: $ui_components
+
+## 🔄 Agent Workflow Status
+
+**Documentation Agent**: $doc_agent_line
+**GitOps Agent**: $gitops_line
+**Workflow Sequence**: Code → Documentation → GitOps ($sequence_status)
+
+## 🎨 UI Compliance Report
+
+**shadcn/ui Status**: $compliance_status
+**Issues Found**: $violations_count
+**Warnings**: $warnings_count
+**Prevention**: Pre-commit hook blocks violations before commit
+
+$compliance_details
+
+## 📂 Git Status
+
+```bash
+# Current branch
+$branch
+
+# Working directory status
+$git_status
+```
+
+## 🎯 Next Session TODOs
+
+$todos
+
+## 🔄 Development Context for Next Session
+
+- **Working Directory**: `$project_root`
+- **Active Feature**: $active_feature
+- **Key Files to Review**: $key_files
+- **Server Management**: VS Code auto-starts servers in visible terminal tabs
+- **Agent Workflow**: Remember Documentation → GitOps sequence
+
+---
+
+*Generated by CChorus pre-compact hook - Optimized for Resource Management Platform development*
+""")
+
+_NEXT_SESSION_TMPL = string.Template("""# CChorus Next Session Brief
+
+**Generated**: $generated
+**Project**: CChorus - Claude Code Resource Management Platform
+
+## 🚀 Quick Resume
+
+**Branch**: $branch
+**Last Activity**: $last_activity
+
+## 🖥️ MANDATORY: Development Server Commands
+
+```bash
+# Navigate to CChorus project
+cd $project_root
+
+# Development servers auto-start in VS Code (no manual commands needed)
+# Frontend and backend start automatically when project opens in VS Code
+# Servers run in visible terminal tabs for easy monitoring
+
+# Manual control (if needed):
+# Cmd+Shift+P → "Tasks: Run Task" → "Start Frontend" or "Start Backend"
+# Or run directly: npm run dev (frontend), npm run dev:server (backend)
+```
+
+## 🚫 PROHIBITED Commands
+
+```bash
+# These are not needed - VS Code handles automatically:
+# /tmux-dev commands are deprecated
+# Servers auto-start via VS Code tasks.json
+```
+
+## 📚 Agent Workflow Reminder
+
+**MANDATORY SEQUENCE**: Code Changes → Documentation Agent → GitOps Agent
+
+```bash
+# When making changes, follow this workflow:
+# 1. Complete your code changes
+# 2. Invoke: @documentation-manager please update documentation for [changes]
+# 3. Verify documentation agent completion
+# 4. Let GitOps agent handle commits and pushes
+```
+
+## 🎯 Active Development Context
+
+Check `docs/sessions/` for the latest session summary with detailed context.
+
+## 📂 Git Status Summary
+
+```
+$git_status
+```
+
+## 🔧 CChorus Development Reminders
+
+- **Resource Library**: Unified browser for all Claude Code resources
+- **Assignment Manager**: Deploy and manage resource assignments
+- **Agent Architecture**: Documentation manager handles docs, GitOps handles Git
+- **Server Management**: VS Code auto-starts servers in visible terminal tabs
+- **Component System**: shadcn/ui + Radix UI with accessibility features
+- **Automated Workflow**: Pre-compact hook now auto-invokes `/docgit` when changes detected
+
+---
+
+*This brief helps you resume CChorus development following all mandatory workflows.*
+""")
+
+# Precedence-ordered classification rules shared by the _identify_* helpers
+# and branch naming. Each entry is (changes_analysis key, minimum count or
+# None for a boolean flag, label returned on first match).
+_FOCUS_RULES = (
+    ('resource_library_modified', None, 'Resource Library Development'),
+    ('assignment_manager_modified', None, 'Assignment Manager Development'),
+    ('component_files', 0, 'UI Component Development'),
+    ('api_changes', 0, 'Backend API Development'),
+    ('agent_system_modified', None, 'Agent System Development'),
+)
+
+_FEATURE_RULES = (
+    ('resource_library_modified', None, 'Resource Library Enhancement'),
+    ('assignment_manager_modified', None, 'Assignment Manager Development'),
+    ('component_files', 0, 'UI Component Development'),
+)
+
+_BRANCH_RULES = (
+    ('resource_library_modified', None, 'feature/resource-library-enhancement'),
+    ('assignment_manager_modified', None, 'feature/assignment-manager-improvement'),
+    ('api_changes', 0, 'feature/api-enhancement'),
+    ('component_files', 2, 'feature/ui-component-work'),
+)
+
+# Single compiled alternation for the change classifier: one C-level scan
+# per status line instead of a chain of Python substring tests. Dispatch is
+# on group name, in the same precedence order as the original elif ladder.
+_FILE_RE = re.compile(
+    r'(?P<component>src/components/)'
+    r'|(?P<api>server\.js)'
+    r'|(?P<doc>\.md\Z|docs/)'
+    r'|(?P<agents>\.claude/agents/)'
+)
+
+# Changelog insertion points: the first version header, then the next
+# subsection or version header after it. Compiled once; each is a single
+# C-level scan over the changelog text.
+_VERSION_HEADER_RE = re.compile(r'^## \[.*?\] -.*$', re.M)
+_SUBSECTION_RE = re.compile(r'^(?:### |## \[)', re.M)
+
+# Commit subjects that already mention documentation, as one compiled
+# case-insensitive alternation instead of lowercasing each subject and
+# probing four keywords in Python.
+_DOC_COMMIT_RE = re.compile(r'docs?:|documentation|readme', re.IGNORECASE)
+
+# Emoji-prefixed lines for the achievements generator, defined once at
+# module scope so every hook run reuses the same interned strings.
+_ACHIEVEMENT_TEMPLATES = {
+    'resource_library': "🎯 Enhanced Resource Library functionality",
+    'assignment_manager': "📋 Improved Assignment Manager capabilities",
+    'components': "🧩 Modified {} UI components",
+    'api': "🔌 Updated backend API endpoints",
+    'agent_system': "🤖 Enhanced agent system configuration",
+    'writes': "📝 Created {} new files",
+    'edits': "✏️ Modified {} files",
+    'idle': "🔄 Session in progress - preparing for next development phase",
+}
+
+# Fixed TODO block appended to every next-session list.
+_STANDARD_TODOS = (
+    "- [ ] Verify VS Code auto-start development servers work correctly\n"
+    "- [ ] Test complete Resource Library → Assignment workflow\n"
+    "- [ ] Check all three navigation tabs (Library, Assignments, Agents)\n"
+    "- [ ] Ensure agent workflow sequence is followed: Code → Documentation → GitOps"
+)
+
+# Timeline labels for Edit operations, checked in order against the path.
+_TIMELINE_EDIT_RULES = (
+    ('ResourceLibrary', '🎯 **Resource Library**: Modified'),
+    ('AssignmentManager', '📋 **Assignment Manager**: Modified'),
+    ('server.js', '🔌 **Backend API**: Modified'),
+)
+
+@lru_cache(maxsize=64)
+def _iso_to_epoch(value: str) -> float:
+    """Parse an ISO timestamp to epoch seconds, cached across hook runs.
+
+    The same session start/end timestamps recur on repeated invocations,
+    so the datetime allocation is paid at most once per distinct string.
+    """
+    return datetime.fromisoformat(value).timestamp()
+
+def _first_match(rules, changes_analysis: Dict, default: str) -> str:
+    """Return the label of the first rule satisfied by changes_analysis."""
+    get = changes_analysis.get
+    for key, minimum, label in rules:
+        value = get(key)
+        if value if minimum is None else (value or 0) > minimum:
+            return label
+    return default
+
 class CChorusPreCompactHook:
     def __init__(self):
         self.project_root = Path(__file__).parent.parent.parent
@@ -22,7 +299,21 @@ class CChorusPreCompactHook:
         self.compact_tracking_path = self.project_root / ".claude" / "compact-tracking.json"
         self.token_usage_path = self.project_root / ".claude" / "token-usage.json"
         self.debug = os.environ.get('CLAUDE_HOOKS_DEBUG', '').lower() == 'true'
-        
+
+        # One timestamp per hook run: helpers reuse these pre-formatted
+        # strings instead of each calling datetime.now() again.
+        self.now = datetime.now()
+        self.now_iso = self.now.isoformat()
+        self.now_clock = self.now.strftime('%I:%M:%S%p').lower()
+        self.now_human = self.now.strftime('%Y-%m-%d %H:%M')
+
+        # Lazily populated by _git_state: one git subprocess per hook run.
+        self._git_state_cache = None
+
+        # Tool usage counts, refreshed by _load_session_operations and shared
+        # by the achievement and changelog generators.
+        self._tools_used = Counter()
+
         # Load GitOps configuration
         self.config = self._load_config()
         
@@ -32,11 +323,31 @@ class CChorusPreCompactHook:
     def _load_config(self) -> dict:
         """Load CChorus GitOps configuration."""
         try:
-            with open(self.config_path) as f:
-                return json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError) as e:
+            with open(self.config_path, 'rb') as f:
+                return _loads(f.read())
+        except (FileNotFoundError, ValueError) as e:
             self.log(f"Could not load GitOps config: {e}")
             return {"gitops": {"enabled": True}}
+
+    def _read_session(self) -> dict:
+        """Read the shared session file (binary mode, fast JSON path)."""
+        with open(self.session_file, 'rb') as f:
+            return _loads(f.read())
+
+    def _atomic_write(self, path: Path, data: bytes):
+        """Write data to path via a temp file and os.replace.
+
+        A crashed hook can never leave a truncated file behind; readers see
+        either the old contents or the new ones.
+        """
+        tmp_path = path.with_suffix(path.suffix + '.tmp')
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def _write_session(self, session_data: dict):
+        """Write the shared session file (binary mode, fast JSON path)."""
+        self._atomic_write(self.session_file, _dumps(session_data))
     
     def log(self, message: str):
         """Log debug messages."""
@@ -66,24 +377,23 @@ class CChorusPreCompactHook:
             }
             
             if self.compact_tracking_path.exists():
-                with open(self.compact_tracking_path, 'r') as f:
-                    compact_data = json.load(f)
-            
+                with open(self.compact_tracking_path, 'rb') as f:
+                    compact_data = _loads(f.read())
+
             # Load current token usage to get total tokens
             total_tokens = 0
             if self.token_usage_path.exists():
-                with open(self.token_usage_path, 'r') as f:
-                    token_data = json.load(f)
-                    total_tokens = token_data.get('totalTokens', 0)
+                with open(self.token_usage_path, 'rb') as f:
+                    total_tokens = _loads(f.read()).get('totalTokens', 0)
             
             # Create compact event record
             compact_event = {
                 "type": "compact",
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": self.now_iso,
                 "sessionId": session_id,
                 "totalTokensAtEvent": total_tokens,
                 "trigger": trigger,
-                "formattedTime": datetime.now().strftime('%I:%M:%S%p').lower()
+                "formattedTime": self.now_clock
             }
             
             # Update tracking data
@@ -105,13 +415,13 @@ class CChorusPreCompactHook:
                 compact_data["currentSession"] = {
                     "sessionId": session_id,
                     "compactsThisSession": 1,
-                    "sessionStartTime": datetime.now().isoformat(),
+                    "sessionStartTime": self.now_iso,
                     "tokensSinceLastEvent": 0
                 }
             
             # Save updated tracking data
-            with open(self.compact_tracking_path, 'w') as f:
-                json.dump(compact_data, f, indent=2)
+            with open(self.compact_tracking_path, 'wb') as f:
+                f.write(_dumps(compact_data))
             
             self.log(f"Tracked compact event: {trigger} at {compact_event['formattedTime']} with {total_tokens} total tokens (session compacts: {compact_data['currentSession']['compactsThisSession']})")
             
@@ -130,38 +440,50 @@ class CChorusPreCompactHook:
             # Track the compact event for token monitoring
             self._track_compact_event(session_id, trigger)
             
-            # Step 1: Coordinate with documentation manager agent
-            doc_agent_status = self._coordinate_with_doc_agent()
-            
-            # Step 2: Report UI compliance status for historical tracking
-            ui_compliance_status = self._report_ui_compliance()
-            
+            # Steps 1-2 and the change analysis are independent and spend their
+            # time blocked on subprocess I/O, so run them concurrently and join
+            # before step 3 (which consumes their outputs).
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                doc_agent_future = executor.submit(self._coordinate_with_doc_agent)
+                ui_compliance_future = executor.submit(self._report_ui_compliance)
+                changes_future = executor.submit(lambda: self.changes_analysis)
+
+                # Step 1: Coordinate with documentation manager agent
+                doc_agent_status = doc_agent_future.result()
+
+                # Step 2: Report UI compliance status for historical tracking
+                ui_compliance_status = ui_compliance_future.result()
+
+                # Get changes analysis for branch creation
+                changes_analysis = changes_future.result()
+
             # Load session operations for analysis
-            session_operations = self._load_session_operations()
-            
+            session_operations = self.session_operations
+
+            # Both generators need the branch and working-tree status; resolve
+            # them once here instead of re-execing git inside each generator.
+            branch = self._get_current_branch()
+            status_text = self._get_git_status()
+
             # Step 3: Generate CChorus-specific session documentation
             session_doc_path = self._generate_cchorus_session_doc(
-                session_id, trigger, custom_instructions, doc_agent_status, ui_compliance_status
+                session_id, trigger, custom_instructions, doc_agent_status, ui_compliance_status,
+                branch=branch, status_text=status_text
             )
-            
+
             # Step 4: Create CChorus-specific next session brief
-            self._create_cchorus_next_session_brief()
-            
-            # Get changes analysis for branch creation
-            changes_analysis = self._analyze_cchorus_changes()
-            
+            self._create_cchorus_next_session_brief(branch, status_text)
+
             # Step 5: Analyze work scope for branch creation triggers
             branch_analysis = self._analyze_branch_creation_needs(session_operations, changes_analysis)
             
-            # Step 6: Prepare for GitOps agent coordination
+            # Steps 6-7: Prepare for GitOps agent coordination. Session data
+            # is preserved for the GitOps agent; the ready markers ride along
+            # in the same write as the coordination metadata.
             gitops_ready = self._prepare_for_gitops(session_id, trigger, branch_analysis)
-            
-            # Step 7: Clean up session data
-            if self.session_file.exists():
-                # Preserve session data for GitOps agent, just mark as ready
-                self._mark_session_ready_for_gitops()
+            if gitops_ready:
                 self.log("Marked session ready for GitOps agent")
-            
+
             # Optional: Stop file watcher on session end
             self._handle_file_watcher_shutdown()
             
@@ -206,16 +528,15 @@ class CChorusPreCompactHook:
     def _detect_pending_doc_changes(self) -> bool:
         """Detect if there are changes that require documentation updates."""
         try:
-            # Check for uncommitted changes in key directories
-            result = subprocess.run(
-                ['git', 'status', '--porcelain', 'src/', 'server.js', 'CLAUDE.md'],
-                capture_output=True,
-                text=True,
-                cwd=self.project_root
-            )
-            
-            changes = result.stdout.strip()
-            if changes:
+            # Check for uncommitted changes in key directories by filtering
+            # the memoized git state instead of forking a second path-scoped
+            # git status
+            entries = [(xy, path) for xy, path in self._git_state['entries']
+                       if path.startswith('src/') or path in ('server.js', 'CLAUDE.md')]
+
+            if entries:
+                changes = "\n".join(f"{xy.replace('.', ' ')} {path}"
+                                    for xy, path in entries)
                 self.log(f"Detected changes requiring documentation: {changes[:100]}...")
                 
                 # Enhanced analysis: categorize changes
@@ -287,15 +608,15 @@ class CChorusPreCompactHook:
             result = subprocess.run([
                 'git', 'log', '--since=1 hour ago', '--pretty=format:%s', '--', 
                 'src/', 'server.js'
-            ], capture_output=True, text=True, cwd=self.project_root)
-            
-            if result.stdout.strip():
-                recent_commits = result.stdout.strip().split('\n')
+            ], capture_output=True, cwd=self.project_root)
+
+            stdout = result.stdout.decode('utf-8', 'replace').strip()
+            if stdout:
+                recent_commits = stdout.split('\n')
                 # Filter out commits that already mention documentation
                 commits_needing_docs = [
-                    commit for commit in recent_commits 
-                    if not any(keyword in commit.lower() for keyword in 
-                              ['docs:', 'doc:', 'documentation', 'readme'])
+                    commit for commit in recent_commits
+                    if not _DOC_COMMIT_RE.search(commit)
                 ]
                 
                 if commits_needing_docs:
@@ -314,30 +635,28 @@ class CChorusPreCompactHook:
         
         try:
             # Check if claude command is available
-            result = subprocess.run(['which', 'claude'], 
-                                  capture_output=True, 
-                                  text=True)
-            
+            result = subprocess.run(['which', 'claude'],
+                                  capture_output=True)
+
             if result.returncode != 0:
                 self.log("Claude CLI command not found in PATH - trying fallback methods")
                 return self._try_fallback_documentation_trigger()
-            
-            claude_path = result.stdout.strip()
+
+            claude_path = result.stdout.decode('utf-8', 'replace').strip()
             self.log(f"Found Claude CLI at: {claude_path}")
             
             # Execute the /docgit command
             self.log("Executing: claude /docgit")
             result = subprocess.run([claude_path, '/docgit'],
                                   capture_output=True,
-                                  text=True,
                                   cwd=self.project_root,
                                   timeout=300)  # 5 minute timeout
-            
-            # Log the command output
+
+            # Log the command output, decoding only what gets shown
             if result.stdout:
-                self.log(f"Command stdout: {result.stdout[:500]}...")
+                self.log(f"Command stdout: {result.stdout[:500].decode('utf-8', 'replace')}...")
             if result.stderr:
-                self.log(f"Command stderr: {result.stderr[:500]}...")
+                self.log(f"Command stderr: {result.stderr[:500].decode('utf-8', 'replace')}...")
             
             if result.returncode == 0:
                 self.log("Successfully completed /docgit workflow")
@@ -364,15 +683,15 @@ class CChorusPreCompactHook:
             # Method 1: Create a documentation trigger file
             trigger_file = self.project_root / ".claude" / "doc-update-needed.trigger"
             trigger_content = {
-                "timestamp": datetime.now().strftime('%I:%M:%S%p').lower(),
+                "timestamp": self.now_clock,
                 "reason": "Auto-triggered by pre-compact hook",
                 "changes_detected": True,
                 "workflow": "documentation-manager -> gitops-workflow-manager",
                 "instructions": "Run: @documentation-manager update docs then @gitops-workflow-manager commit"
             }
             
-            with open(trigger_file, 'w') as f:
-                json.dump(trigger_content, f, indent=2)
+            with open(trigger_file, 'wb') as f:
+                f.write(_dumps(trigger_content))
             
             self.log(f"Created documentation trigger file: {trigger_file}")
             
@@ -400,7 +719,7 @@ class CChorusPreCompactHook:
             reminder_section = f"""
 ## 🚨 URGENT: Documentation Update Required
 
-**Auto-detected by pre-compact hook at {datetime.now().strftime('%Y-%m-%d %H:%M')}**
+**Auto-detected by pre-compact hook at {self.now_human}**
 
 ```bash
 # REQUIRED: Run this workflow immediately when session starts
@@ -416,21 +735,33 @@ class CChorusPreCompactHook:
 
 """
             
-            if next_session_path.exists():
+            try:
                 content = next_session_path.read_text()
-                # Insert after the first header
-                lines = content.split('\n')
-                for i, line in enumerate(lines):
-                    if line.startswith('# '):
-                        lines.insert(i + 1, reminder_section)
-                        break
-                
-                next_session_path.write_text('\n'.join(lines))
+            except FileNotFoundError:
+                # New file: one exclusive create + write, no read-modify cycle.
+                fd = os.open(next_session_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+                try:
+                    os.write(fd, f"# CChorus Next Session Brief{reminder_section}".encode())
+                finally:
+                    os.close(fd)
             else:
-                # Create new file with reminder
-                content = f"# CChorus Next Session Brief{reminder_section}"
-                next_session_path.write_text(content)
-            
+                # Splice the reminder in directly after the first header line
+                # instead of the split('\n') + insert + join round trip.
+                if content.startswith('# '):
+                    header_start = 0
+                else:
+                    newline_pos = content.find('\n# ')
+                    header_start = newline_pos + 1 if newline_pos != -1 else -1
+
+                if header_start != -1:
+                    header_end = content.find('\n', header_start)
+                    if header_end == -1:
+                        content = content + '\n' + reminder_section
+                    else:
+                        content = (content[:header_end + 1] + reminder_section +
+                                   '\n' + content[header_end + 1:])
+                    next_session_path.write_text(content)
+
             self.log("Added documentation reminder to NEXT_SESSION.md")
             
         except Exception as e:
@@ -445,32 +776,25 @@ class CChorusPreCompactHook:
                 self.log("Documentation manager agent file not found")
                 return False
             
-            # Create an agent invocation trigger
-            invocation_file = self.project_root / ".claude" / "pending-agent-invocations.json"
-            
-            invocations = []
-            if invocation_file.exists():
-                try:
-                    with open(invocation_file, 'r') as f:
-                        invocations = json.load(f)
-                except:
-                    invocations = []
-            
+            # Create an agent invocation trigger. The queue is append-only
+            # JSON Lines: one record per line, appended in O(1) without
+            # parsing or rewriting prior entries, and atomic at the OS level
+            # for small writes so concurrent hooks cannot lose entries.
+            invocation_file = self.project_root / ".claude" / "pending-agent-invocations.jsonl"
+
             # Add documentation manager invocation
             new_invocation = {
                 "agent": "documentation-manager",
-                "timestamp": datetime.now().strftime('%I:%M:%S%p').lower(),
+                "timestamp": self.now_clock,
                 "trigger": "pre-compact-auto",
                 "prompt": "Auto-triggered: Please update documentation for code changes detected by pre-compact hook",
                 "priority": "high",
                 "auto_triggered": True
             }
-            
-            invocations.append(new_invocation)
-            
-            with open(invocation_file, 'w') as f:
-                json.dump(invocations, f, indent=2)
-            
+
+            with open(invocation_file, 'ab') as f:
+                f.write(_dumps_line(new_invocation) + b'\n')
+
             self.log("Created agent invocation trigger for documentation-manager")
             return True
             
@@ -499,12 +823,11 @@ class CChorusPreCompactHook:
                 result = subprocess.run(
                     ['grep', '-r', f'from.*{pattern}', 'src/'],
                     capture_output=True,
-                    text=True,
                     cwd=self.project_root
                 )
-                
+
                 if result.returncode == 0:  # Found violations
-                    violations = result.stdout.strip().split('\n')
+                    violations = result.stdout.decode('utf-8', 'replace').strip().split('\n')
                     compliance_status["compliant"] = False
                     compliance_status["violations"].extend([
                         f"Prohibited import '{pattern}' found: {violation}" 
@@ -515,12 +838,11 @@ class CChorusPreCompactHook:
             result = subprocess.run(
                 ['grep', '-r', 'style={{', 'src/'],
                 capture_output=True,
-                text=True,
                 cwd=self.project_root
             )
-            
+
             if result.returncode == 0:
-                violations = result.stdout.strip().split('\n')
+                violations = result.stdout.decode('utf-8', 'replace').strip().split('\n')
                 compliance_status["warnings"].extend([
                     f"Inline style found: {violation}"
                     for violation in violations if violation
@@ -530,7 +852,6 @@ class CChorusPreCompactHook:
             result = subprocess.run(
                 ['grep', '-r', '@/components/ui', 'src/'],
                 capture_output=True,
-                text=True,
                 cwd=self.project_root
             )
             
@@ -549,187 +870,79 @@ class CChorusPreCompactHook:
                 "warnings": []
             }
     
-    def _generate_cchorus_session_doc(self, session_id: str, trigger: str, 
-                                    custom_instructions: str, doc_agent_status: bool, ui_compliance_status: dict) -> Path:
+    def _generate_cchorus_session_doc(self, session_id: str, trigger: str,
+                                    custom_instructions: str, doc_agent_status: bool, ui_compliance_status: dict,
+                                    branch: str, status_text: str) -> Path:
         """Generate CChorus-specific session documentation."""
-        timestamp = datetime.now()
+        timestamp = self.now
         doc_filename = f"SESSION_{timestamp.strftime('%Y-%m-%d_%H-%M')}_CCHORUS.md"
         doc_path = self.session_docs_dir / doc_filename
         
-        # Load session operations
-        session_operations = self._load_session_operations()
-        
-        # Analyze CChorus-specific changes
-        changes_analysis = self._analyze_cchorus_changes()
+        # Both memoized on the instance: no re-parse or re-classify when
+        # process() has already touched them.
+        session_operations = self.session_operations
+        changes_analysis = self.changes_analysis
         
         # Update CHANGELOG.md with session summary
         self._update_changelog(session_operations, changes_analysis, timestamp)
-        
-        # Generate CChorus-focused content
-        content = f"""# CChorus Development Session Summary
-
-**Session ID**: {session_id}
-**Date**: {timestamp.strftime('%B %d, %Y %H:%M')}
-**Trigger**: {trigger.capitalize()} compaction
-**Project**: CChorus - Claude Code Resource Management Platform
-{f'**Instructions**: {custom_instructions}' if custom_instructions else ''}
-
-## 🎯 Session Focus
-
-**Development Area**: {self._identify_development_focus(changes_analysis)}
-**Component Work**: {self._identify_component_work(changes_analysis)}
-**Agent Workflow**: Documentation → GitOps sequence {'✅ Followed' if doc_agent_status else '🤖 Auto-invoked via /docgit' if doc_agent_status is None else '⚠️ Pending doc updates'}
-
-## 📊 Session Metrics
-
-- **Duration**: {self._calculate_session_duration(session_operations)}
-- **Operations**: {len(session_operations)} tool uses
-- **Files Changed**: {changes_analysis.get('files_changed', 0)}
-- **Component Files**: {changes_analysis.get('component_files', 0)}
-- **API Endpoints**: {changes_analysis.get('api_changes', 0)}
-- **Documentation Files**: {changes_analysis.get('doc_files', 0)}
-
-## 🚀 CChorus Achievements
-
-{self._generate_cchorus_achievements(session_operations, changes_analysis)}
-
-## 🔧 Code Changes Analysis
-
-{self._generate_cchorus_code_changes(changes_analysis)}
-
-## 🛠️ Key Operations Timeline
-
-{self._generate_operations_timeline(session_operations)}
-
-## 📋 CChorus-Specific Context
-
-**Resource Library Development**: {changes_analysis.get('resource_library_work', 'No changes')}
-**Assignment Manager Work**: {changes_analysis.get('assignment_manager_work', 'No changes')}
-**Agent System Changes**: {changes_analysis.get('agent_system_work', 'No changes')}
-**UI Components Modified**: {changes_analysis.get('ui_components', [])}
-
-## 🔄 Agent Workflow Status
-
-**Documentation Agent**: {'✅ Coordinated' if doc_agent_status else '🤖 Auto-invoked via /docgit workflow'}
-**GitOps Agent**: {'✅ Completed via /docgit' if doc_agent_status else '🕐 Ready to handle commits after session end'}
-**Workflow Sequence**: Code → Documentation → GitOps ({'✅ Completed' if doc_agent_status else '🤖 Auto-executed via /docgit'})
-
-## 🎨 UI Compliance Report
-
-**shadcn/ui Status**: {'✅ Compliant' if ui_compliance_status.get('compliant', False) else '⚠️ Issues noted'}
-**Issues Found**: {len(ui_compliance_status.get('violations', []))}
-**Warnings**: {len(ui_compliance_status.get('warnings', []))}
-**Prevention**: Pre-commit hook blocks violations before commit
-
-{self._format_ui_compliance_details(ui_compliance_status)}
-
-## 📂 Git Status
-
-```bash
-# Current branch
-{self._get_current_branch()}
-
-# Working directory status
-{self._get_git_status()}
-```
-
-## 🎯 Next Session TODOs
-
-{self._generate_cchorus_todos(session_operations, changes_analysis, doc_agent_status)}
-
-## 🔄 Development Context for Next Session
-
-- **Working Directory**: `{self.project_root}`
-- **Active Feature**: {self._identify_active_feature(changes_analysis)}
-- **Key Files to Review**: {self._list_key_cchorus_files(changes_analysis)}
-- **Server Management**: VS Code auto-starts servers in visible terminal tabs
-- **Agent Workflow**: Remember Documentation → GitOps sequence
 
----
+        # Build the ~20 variable substitutions once; the static markdown
+        # skeleton lives in _SESSION_DOC_TMPL at module level.
+        subs = {
+            'session_id': session_id,
+            'date': timestamp.strftime('%B %d, %Y %H:%M'),
+            'trigger': trigger.capitalize(),
+            'instructions_line': f'**Instructions**: {custom_instructions}' if custom_instructions else '',
+            'development_focus': self._identify_development_focus(changes_analysis),
+            'component_work': self._identify_component_work(changes_analysis),
+            'workflow_status': '✅ Followed' if doc_agent_status else '🤖 Auto-invoked via /docgit' if doc_agent_status is None else '⚠️ Pending doc updates',
+            'duration': self._calculate_session_duration(session_operations),
+            'operations_count': len(session_operations),
+            'files_changed': changes_analysis.get('files_changed', 0),
+            'component_files': changes_analysis.get('component_files', 0),
+            'api_changes': changes_analysis.get('api_changes', 0),
+            'doc_files': changes_analysis.get('doc_files', 0),
+            'achievements': self._generate_cchorus_achievements(session_operations, changes_analysis),
+            'code_changes': self._generate_cchorus_code_changes(changes_analysis),
+            'timeline': self._generate_operations_timeline(session_operations),
+            'resource_library_work': changes_analysis.get('resource_library_work', 'No changes'),
+            'assignment_manager_work': changes_analysis.get('assignment_manager_work', 'No changes'),
+            'agent_system_work': changes_analysis.get('agent_system_work', 'No changes'),
+            'ui_components': list(changes_analysis.get('ui_components', ())),
+            'doc_agent_line': '✅ Coordinated' if doc_agent_status else '🤖 Auto-invoked via /docgit workflow',
+            'gitops_line': '✅ Completed via /docgit' if doc_agent_status else '🕐 Ready to handle commits after session end',
+            'sequence_status': '✅ Completed' if doc_agent_status else '🤖 Auto-executed via /docgit',
+            'compliance_status': '✅ Compliant' if ui_compliance_status.get('compliant', False) else '⚠️ Issues noted',
+            'violations_count': len(ui_compliance_status.get('violations', [])),
+            'warnings_count': len(ui_compliance_status.get('warnings', [])),
+            'compliance_details': self._format_ui_compliance_details(ui_compliance_status),
+            'branch': branch,
+            'git_status': status_text,
+            'todos': self._generate_cchorus_todos(session_operations, changes_analysis, doc_agent_status),
+            'project_root': self.project_root,
+            'active_feature': self._identify_active_feature(changes_analysis),
+            'key_files': self._list_key_cchorus_files(changes_analysis),
+        }
 
-*Generated by CChorus pre-compact hook - Optimized for Resource Management Platform development*
-"""
-        
         # Write documentation
-        doc_path.write_text(content)
+        doc_path.write_text(_SESSION_DOC_TMPL.substitute(subs))
         self.log(f"Created CChorus session documentation: {doc_path}")
         
         return doc_path
     
-    def _create_cchorus_next_session_brief(self):
+    def _create_cchorus_next_session_brief(self, branch: str, status_text: str):
         """Create CChorus-specific next session brief with proper commands."""
         brief_path = self.project_root / "NEXT_SESSION.md"
-        
-        content = f"""# CChorus Next Session Brief
-
-**Generated**: {datetime.now().strftime('%Y-%m-%d %H:%M')}
-**Project**: CChorus - Claude Code Resource Management Platform
-
-## 🚀 Quick Resume
-
-**Branch**: {self._get_current_branch()}
-**Last Activity**: {datetime.now().strftime('%B %d, %Y')}
-
-## 🖥️ MANDATORY: Development Server Commands
-
-```bash
-# Navigate to CChorus project
-cd {self.project_root}
-
-# Development servers auto-start in VS Code (no manual commands needed)
-# Frontend and backend start automatically when project opens in VS Code
-# Servers run in visible terminal tabs for easy monitoring
-
-# Manual control (if needed):
-# Cmd+Shift+P → "Tasks: Run Task" → "Start Frontend" or "Start Backend"
-# Or run directly: npm run dev (frontend), npm run dev:server (backend)
-```
-
-## 🚫 PROHIBITED Commands
-
-```bash
-# These are not needed - VS Code handles automatically:
-# /tmux-dev commands are deprecated
-# Servers auto-start via VS Code tasks.json
-```
-
-## 📚 Agent Workflow Reminder
-
-**MANDATORY SEQUENCE**: Code Changes → Documentation Agent → GitOps Agent
-
-```bash
-# When making changes, follow this workflow:
-# 1. Complete your code changes
-# 2. Invoke: @documentation-manager please update documentation for [changes]
-# 3. Verify documentation agent completion
-# 4. Let GitOps agent handle commits and pushes
-```
-
-## 🎯 Active Development Context
-
-Check `docs/sessions/` for the latest session summary with detailed context.
-
-## 📂 Git Status Summary
-
-```
-{self._get_git_status()}
-```
-
-## 🔧 CChorus Development Reminders
-
-- **Resource Library**: Unified browser for all Claude Code resources
-- **Assignment Manager**: Deploy and manage resource assignments  
-- **Agent Architecture**: Documentation manager handles docs, GitOps handles Git
-- **Server Management**: VS Code auto-starts servers in visible terminal tabs
-- **Component System**: shadcn/ui + Radix UI with accessibility features
-- **Automated Workflow**: Pre-compact hook now auto-invokes `/docgit` when changes detected
 
----
+        subs = {
+            'generated': self.now_human,
+            'branch': branch,
+            'last_activity': self.now.strftime('%B %d, %Y'),
+            'project_root': self.project_root,
+            'git_status': status_text,
+        }
 
-*This brief helps you resume CChorus development following all mandatory workflows.*
-"""
-        
-        brief_path.write_text(content)
+        brief_path.write_text(_NEXT_SESSION_TMPL.substitute(subs))
         self.log("Created CChorus-specific NEXT_SESSION.md")
     
     def _analyze_branch_creation_needs(self, operations: List[Dict], changes_analysis: Dict) -> Dict:
@@ -911,22 +1124,10 @@ Check `docs/sessions/` for the latest session summary with detailed context.
                 return branch_analysis
             
             # Generate intelligent branch name based on changes
-            if changes_analysis.get('resource_library_work') != 'No changes':
-                branch_analysis["suggested_branch_name"] = "feature/resource-library-enhancement"
-                branch_analysis["branch_type"] = "feature"
-            elif changes_analysis.get('assignment_manager_work') != 'No changes':
-                branch_analysis["suggested_branch_name"] = "feature/assignment-manager-improvement"
-                branch_analysis["branch_type"] = "feature"
-            elif changes_analysis.get('api_changes', 0) > 0:
-                branch_analysis["suggested_branch_name"] = "feature/api-enhancement"
-                branch_analysis["branch_type"] = "feature"
-            elif changes_analysis.get('component_files', 0) > 2:
-                branch_analysis["suggested_branch_name"] = "feature/ui-component-work"
-                branch_analysis["branch_type"] = "feature"
-            else:
-                branch_analysis["suggested_branch_name"] = "feature/general-development"
-                branch_analysis["branch_type"] = "feature"
-            
+            branch_analysis["suggested_branch_name"] = _first_match(
+                _BRANCH_RULES, changes_analysis, "feature/general-development")
+            branch_analysis["branch_type"] = "feature"
+
             return branch_analysis
             
         except Exception as e:
@@ -935,142 +1136,190 @@ Check `docs/sessions/` for the latest session summary with detailed context.
     
     def _prepare_for_gitops(self, session_id: str, trigger: str, branch_analysis: Dict = None) -> bool:
         """Prepare session data for GitOps agent coordination."""
+        # Coordination metadata and ready markers for the GitOps agent,
+        # applied in a single read/update/write cycle.
+        flags = {
+            'precompact_complete': True,
+            'documentation_coordinated': True,
+            'cchorus_session': True,
+            'ready_for_gitops': True,
+            'precompact_ready': True,
+            'cchorus_documented': True,
+            'session_id': session_id,
+            'trigger': trigger,
+        }
+
+        # Add branch analysis for GitOps agent
+        if branch_analysis:
+            flags['branch_analysis'] = branch_analysis
+            if branch_analysis.get('should_create_branch'):
+                flags['branch_creation_recommended'] = True
+                flags['suggested_branch_name'] = branch_analysis.get('suggested_branch_name')
+                flags['branch_priority'] = branch_analysis.get('priority', 'medium')
+                self.log(f"Added branch creation recommendation: {branch_analysis['suggested_branch_name']}")
+
+        if self._apply_session_flags(flags):
+            self.log("Prepared session data for GitOps agent")
+            return True
+
+        return False
+
+    def _apply_session_flags(self, flags: Dict) -> bool:
+        """Merge flags into the session file with one read and one write."""
         try:
             if self.session_file.exists():
-                # Add coordination metadata for GitOps agent
-                with open(self.session_file, 'r') as f:
-                    session_data = json.load(f)
-                
-                session_data['precompact_complete'] = True
-                session_data['documentation_coordinated'] = True
-                session_data['cchorus_session'] = True
-                session_data['ready_for_gitops'] = True
-                session_data['session_id'] = session_id
-                session_data['trigger'] = trigger
-                
-                # Add branch analysis for GitOps agent
-                if branch_analysis:
-                    session_data['branch_analysis'] = branch_analysis
-                    if branch_analysis.get('should_create_branch'):
-                        session_data['branch_creation_recommended'] = True
-                        session_data['suggested_branch_name'] = branch_analysis.get('suggested_branch_name')
-                        session_data['branch_priority'] = branch_analysis.get('priority', 'medium')
-                        self.log(f"Added branch creation recommendation: {branch_analysis['suggested_branch_name']}")
-                
-                with open(self.session_file, 'w') as f:
-                    json.dump(session_data, f, indent=2)
-                
-                self.log("Prepared session data for GitOps agent")
+                session_data = self._read_session()
+                session_data.update(flags)
+                self._write_session(session_data)
                 return True
-            
+
             return False
-            
+
         except Exception as e:
-            self.log(f"Could not prepare for GitOps: {e}")
+            self.log(f"Could not update session flags: {e}")
             return False
     
-    def _mark_session_ready_for_gitops(self):
-        """Mark session as ready for GitOps agent processing."""
-        try:
-            if self.session_file.exists():
-                with open(self.session_file, 'r') as f:
-                    session_data = json.load(f)
-                
-                session_data['precompact_ready'] = True
-                session_data['cchorus_documented'] = True
-                
-                with open(self.session_file, 'w') as f:
-                    json.dump(session_data, f, indent=2)
-                
-        except Exception as e:
-            self.log(f"Could not mark session ready: {e}")
-    
+    @cached_property
+    def session_operations(self) -> List[Dict]:
+        """Session operations, loaded at most once per hook lifetime."""
+        return self._load_session_operations()
+
+    @cached_property
+    def changes_analysis(self) -> Dict:
+        """Classified working-tree changes, computed at most once per hook."""
+        return self._analyze_cchorus_changes()
+
     def _load_session_operations(self) -> List[Dict]:
-        """Load operations from session file."""
+        """Load operations from session file and refresh the tool counter."""
+        operations = []
         try:
             if self.session_file.exists():
-                with open(self.session_file) as f:
-                    data = json.load(f)
-                    return data.get('operations', [])
+                operations = self._read_session().get('operations', [])
         except Exception as e:
             self.log(f"Could not load session operations: {e}")
-        
-        return []
+
+        self._tools_used = Counter(op.get('tool', 'Unknown') for op in operations)
+        return operations
     
+    @property
+    def _git_state(self) -> Dict:
+        """Branch name and status entries from a single git invocation.
+
+        Runs `git status --porcelain=v2 --branch` once per hook lifetime and
+        memoizes the parsed result so _get_current_branch, _get_git_status and
+        _analyze_cchorus_changes no longer each fork their own git process.
+        """
+        if self._git_state_cache is None:
+            state = {'branch': 'unknown', 'entries': []}
+            try:
+                result = subprocess.run(
+                    ['git', 'status', '--porcelain=v2', '--branch'],
+                    capture_output=True,
+                    cwd=self.project_root
+                )
+                entries = state['entries']
+                for line in result.stdout.decode('utf-8', 'replace').splitlines():
+                    if line.startswith('# branch.head '):
+                        state['branch'] = line[14:] or 'unknown'
+                    elif line.startswith('1 '):
+                        parts = line.split(' ', 8)
+                        entries.append((parts[1], parts[8]))
+                    elif line.startswith('2 '):
+                        parts = line.split(' ', 9)
+                        entries.append((parts[1], parts[9].split('\t', 1)[0]))
+                    elif line.startswith('? '):
+                        entries.append(('??', line[2:]))
+                    elif line.startswith('u '):
+                        parts = line.split(' ', 10)
+                        entries.append((parts[1], parts[10]))
+            except Exception as e:
+                self.log(f"Could not read git state: {e}")
+            self._git_state_cache = state
+        return self._git_state_cache
+
     def _analyze_cchorus_changes(self) -> Dict:
         """Analyze changes with CChorus-specific context."""
         try:
-            # Get changed files
-            result = subprocess.run(
-                ['git', 'status', '--porcelain'],
-                capture_output=True,
-                text=True,
-                cwd=self.project_root
-            )
-            
-            changes = result.stdout.strip().split('\n') if result.stdout.strip() else []
-            
-            analysis = {
-                'files_changed': len(changes),
-                'component_files': 0,
-                'api_changes': 0,
-                'doc_files': 0,
-                'ui_components': [],
-                'resource_library_work': 'No changes',
-                'assignment_manager_work': 'No changes',
-                'agent_system_work': 'No changes'
-            }
-            
-            for change in changes:
-                if len(change) < 3:
-                    continue
-                
-                filepath = change[3:]  # Remove status prefix
-                
-                # Analyze CChorus-specific patterns
-                if 'src/components/' in filepath:
-                    analysis['component_files'] += 1
-                    component_name = Path(filepath).stem
-                    analysis['ui_components'].append(component_name)
-                    
-                    if 'ResourceLibrary' in filepath:
-                        analysis['resource_library_work'] = 'Modified'
-                    elif 'AssignmentManager' in filepath:
-                        analysis['assignment_manager_work'] = 'Modified'
-                
-                elif 'server.js' in filepath:
-                    analysis['api_changes'] += 1
-                
-                elif filepath.endswith('.md') or 'docs/' in filepath:
-                    analysis['doc_files'] += 1
-                
-                elif '.claude/agents/' in filepath:
-                    analysis['agent_system_work'] = 'Agent files modified'
-            
-            return analysis
-            
+            # Reconstruct porcelain-v1-shaped lines ("XY path") from the
+            # cached state; v2 uses '.' where v1 uses a space.
+            changes = [f"{xy.replace('.', ' ')} {path}"
+                       for xy, path in self._git_state['entries']]
+
+            return self._classify_changes(changes)
+
         except Exception as e:
             self.log(f"Could not analyze CChorus changes: {e}")
             return {'files_changed': 0}
+
+    def _classify_changes(self, changes: List[str]) -> Dict:
+        """Classify porcelain status lines into a CChorus change set in one pass.
+
+        Emits boolean flags alongside the prose strings so downstream helpers
+        can branch on flags instead of re-deriving them from sentinel strings.
+        """
+        analysis = {
+            'files_changed': len(changes),
+            'component_files': 0,
+            'api_changes': 0,
+            'doc_files': 0,
+            # Insertion-ordered dict doubles as a dedup set, capped at 5
+            # entries at insert time; readers materialize a list on demand.
+            'ui_components': {},
+            'resource_library_modified': False,
+            'assignment_manager_modified': False,
+            'agent_system_modified': False,
+            'resource_library_work': 'No changes',
+            'assignment_manager_work': 'No changes',
+            'agent_system_work': 'No changes'
+        }
+
+        # Bind hot lookups locally: the loop touches these per status line.
+        ui_components = analysis['ui_components']
+        _finditer = _FILE_RE.finditer
+
+        for change in changes:
+            if len(change) < 3:
+                continue
+
+            filepath = change[3:]  # Remove status prefix
+
+            # One regex pass collects every pattern the path matches; the
+            # dispatch below keeps the original precedence order.
+            groups = {m.lastgroup for m in _finditer(filepath)}
+            if not groups:
+                continue
+
+            if 'component' in groups:
+                analysis['component_files'] += 1
+                if len(ui_components) < 5:
+                    ui_components[filepath.rsplit('/', 1)[-1].rsplit('.', 1)[0]] = None
+
+                if 'ResourceLibrary' in filepath:
+                    analysis['resource_library_modified'] = True
+                    analysis['resource_library_work'] = 'Modified'
+                elif 'AssignmentManager' in filepath:
+                    analysis['assignment_manager_modified'] = True
+                    analysis['assignment_manager_work'] = 'Modified'
+
+            elif 'api' in groups:
+                analysis['api_changes'] += 1
+
+            elif 'doc' in groups:
+                analysis['doc_files'] += 1
+
+            elif 'agents' in groups:
+                analysis['agent_system_modified'] = True
+                analysis['agent_system_work'] = 'Agent files modified'
+
+        return analysis
     
     def _identify_development_focus(self, changes_analysis: Dict) -> str:
         """Identify the main development focus of the session."""
-        if changes_analysis.get('resource_library_work') != 'No changes':
-            return "Resource Library Development"
-        elif changes_analysis.get('assignment_manager_work') != 'No changes':
-            return "Assignment Manager Development"
-        elif changes_analysis.get('component_files', 0) > 0:
-            return "UI Component Development"
-        elif changes_analysis.get('api_changes', 0) > 0:
-            return "Backend API Development"
-        elif changes_analysis.get('agent_system_work') != 'No changes':
-            return "Agent System Development"
-        else:
-            return "General CChorus Development"
+        return _first_match(_FOCUS_RULES, changes_analysis, "General CChorus Development")
     
     def _identify_component_work(self, changes_analysis: Dict) -> str:
         """Identify specific component work."""
-        components = changes_analysis.get('ui_components', [])
+        components = list(changes_analysis.get('ui_components', ()))
         if components:
             return f"Modified: {', '.join(components[:3])}" + ("..." if len(components) > 3 else "")
         return "No component changes"
@@ -1083,12 +1332,14 @@ Check `docs/sessions/` for the latest session summary with detailed context.
         try:
             first_op = operations[0].get('timestamp', 0)
             last_op = operations[-1].get('timestamp', 0)
-            
-            if isinstance(first_op, str):
-                first_op = datetime.fromisoformat(first_op).timestamp()
-            if isinstance(last_op, str):
-                last_op = datetime.fromisoformat(last_op).timestamp()
-            
+
+            # Numeric timestamps (time.time()) pass straight through; only
+            # ISO strings pay for parsing, and that parse is memoized.
+            if type(first_op) is str:
+                first_op = _iso_to_epoch(first_op)
+            if type(last_op) is str:
+                last_op = _iso_to_epoch(last_op)
+
             duration_seconds = int(last_op - first_op)
             hours = duration_seconds // 3600
             minutes = (duration_seconds % 3600) // 60
@@ -1102,63 +1353,54 @@ Check `docs/sessions/` for the latest session summary with detailed context.
     
     def _generate_cchorus_achievements(self, operations: List[Dict], changes_analysis: Dict) -> str:
         """Generate CChorus-specific achievements."""
-        achievements = []
-        
-        # Component-specific achievements
-        if changes_analysis.get('resource_library_work') != 'No changes':
-            achievements.append("🎯 Enhanced Resource Library functionality")
-        
-        if changes_analysis.get('assignment_manager_work') != 'No changes':
-            achievements.append("📋 Improved Assignment Manager capabilities")
-        
-        if changes_analysis.get('component_files', 0) > 0:
-            achievements.append(f"🧩 Modified {changes_analysis['component_files']} UI components")
-        
-        if changes_analysis.get('api_changes', 0) > 0:
-            achievements.append("🔌 Updated backend API endpoints")
-        
-        if changes_analysis.get('agent_system_work') != 'No changes':
-            achievements.append("🤖 Enhanced agent system configuration")
-        
-        # Operation-based achievements
-        tools_used = {}
-        for op in operations:
-            tool = op.get('tool', 'Unknown')
-            tools_used[tool] = tools_used.get(tool, 0) + 1
-        
-        if tools_used.get('Write', 0) > 0:
-            achievements.append(f"📝 Created {tools_used['Write']} new files")
-        
-        if tools_used.get('Edit', 0) > 0:
-            achievements.append(f"✏️ Modified {tools_used['Edit']} files")
-        
-        if not achievements:
-            achievements.append("🔄 Session in progress - preparing for next development phase")
-        
-        return "\n".join(achievements)
+        # Cheap bail-out: nothing recorded and nothing changed always yields
+        # the placeholder line, so skip the per-flag checks entirely.
+        if not operations and not changes_analysis.get('files_changed'):
+            return _ACHIEVEMENT_TEMPLATES['idle']
+
+        get = changes_analysis.get
+        tools_used = self._tools_used
+        templates = _ACHIEVEMENT_TEMPLATES
+
+        # Component- and operation-based achievements, joined in one pass
+        achievements = "\n".join(part for part in (
+            templates['resource_library']
+            if get('resource_library_modified') else None,
+            templates['assignment_manager']
+            if get('assignment_manager_modified') else None,
+            templates['components'].format(changes_analysis['component_files'])
+            if get('component_files', 0) > 0 else None,
+            templates['api']
+            if get('api_changes', 0) > 0 else None,
+            templates['agent_system']
+            if get('agent_system_modified') else None,
+            templates['writes'].format(tools_used['Write'])
+            if tools_used['Write'] else None,
+            templates['edits'].format(tools_used['Edit'])
+            if tools_used['Edit'] else None,
+        ) if part)
+
+        return achievements or templates['idle']
     
     def _generate_cchorus_code_changes(self, changes_analysis: Dict) -> str:
         """Generate CChorus-specific code changes analysis."""
         if changes_analysis.get('files_changed', 0) == 0:
             return "No uncommitted changes detected"
         
-        sections = []
-        
-        if changes_analysis.get('component_files', 0) > 0:
-            sections.append(f"### UI Components ({changes_analysis['component_files']} files)")
-            ui_components = changes_analysis.get('ui_components', [])
-            for component in ui_components:
-                sections.append(f"- `{component}.tsx`")
-        
-        if changes_analysis.get('api_changes', 0) > 0:
-            sections.append(f"\n### Backend API ({changes_analysis['api_changes']} changes)")
-            sections.append("- `server.js`")
-        
-        if changes_analysis.get('doc_files', 0) > 0:
-            sections.append(f"\n### Documentation ({changes_analysis['doc_files']} files)")
-            sections.append("- Documentation files updated")
-        
-        return "\n".join(sections) if sections else "Changes detected but not categorized"
+        get = changes_analysis.get
+        component_files = get('component_files', 0)
+
+        sections = "\n".join(section for section in (
+            "\n".join((f"### UI Components ({component_files} files)",
+                       *(f"- `{c}.tsx`" for c in get('ui_components', []))))
+            if component_files > 0 else None,
+            f"\n### Backend API ({changes_analysis['api_changes']} changes)\n- `server.js`"
+            if get('api_changes', 0) > 0 else None,
+            f"\n### Documentation ({changes_analysis['doc_files']} files)\n- Documentation files updated"
+            if get('doc_files', 0) > 0 else None,
+        ) if section)
+
+        return sections or "Changes detected but not categorized"
     
     def _generate_operations_timeline(self, operations: List[Dict]) -> str:
         """Generate timeline of key operations with CChorus context."""
@@ -1170,20 +1412,20 @@ Check `docs/sessions/` for the latest session summary with detailed context.
             tool = op.get('tool', 'Unknown')
             tool_input = op.get('tool_input', {})
             
-            # Extract CChorus-relevant info
+            # Extract CChorus-relevant info; basenames come from rsplit
+            # rather than constructing a Path per operation
             if tool == 'Edit':
                 file_path = tool_input.get('file_path', 'unknown')
-                if 'ResourceLibrary' in file_path:
-                    timeline.append(f"{i+1}. 🎯 **Resource Library**: Modified `{Path(file_path).name}`")
-                elif 'AssignmentManager' in file_path:
-                    timeline.append(f"{i+1}. 📋 **Assignment Manager**: Modified `{Path(file_path).name}`")
-                elif 'server.js' in file_path:
-                    timeline.append(f"{i+1}. 🔌 **Backend API**: Modified `{Path(file_path).name}`")
+                name = file_path.rsplit('/', 1)[-1]
+                for needle, label in _TIMELINE_EDIT_RULES:
+                    if needle in file_path:
+                        timeline.append(f"{i+1}. {label} `{name}`")
+                        break
                 else:
-                    timeline.append(f"{i+1}. ✏️ **Edit**: `{Path(file_path).name}`")
+                    timeline.append(f"{i+1}. ✏️ **Edit**: `{name}`")
             elif tool == 'Write':
                 file_path = tool_input.get('file_path', 'unknown')
-                timeline.append(f"{i+1}. 📝 **Create**: `{Path(file_path).name}`")
+                timeline.append(f"{i+1}. 📝 **Create**: `{file_path.rsplit('/', 1)[-1]}`")
             elif tool == 'Bash':
                 command = tool_input.get('command', 'unknown')[:50]
                 timeline.append(f"{i+1}. 🖥️ **Command**: `{command}...`")
@@ -1193,80 +1435,53 @@ Check `docs/sessions/` for the latest session summary with detailed context.
         return "\n".join(timeline)
     
     def _get_current_branch(self) -> str:
-        """Get current git branch."""
+        """Get current git branch from the cached git state."""
         try:
-            result = subprocess.run(
-                ['git', 'branch', '--show-current'],
-                capture_output=True,
-                text=True,
-                cwd=self.project_root
-            )
-            return result.stdout.strip() or "unknown"
+            return self._git_state['branch']
         except Exception:
             return "unknown"
-    
+
     def _get_git_status(self) -> str:
-        """Get git status output."""
+        """Get short-format git status from the cached git state."""
         try:
-            result = subprocess.run(
-                ['git', 'status', '--short'],
-                capture_output=True,
-                text=True,
-                cwd=self.project_root
-            )
-            return result.stdout or "Working tree clean"
+            entries = self._git_state['entries']
+            if not entries:
+                return "Working tree clean"
+            return "\n".join(f"{xy.replace('.', ' ')} {path}"
+                             for xy, path in entries) + "\n"
         except Exception:
             return "Unable to get git status"
     
     def _generate_cchorus_todos(self, operations: List[Dict], changes_analysis: Dict, doc_agent_status: bool) -> str:
         """Generate CChorus-specific TODOs for next session."""
-        todos = []
-        
-        # Documentation workflow TODOs
-        if not doc_agent_status:
-            todos.append("- [ ] **INFO**: /docgit workflow was auto-invoked for pending changes")
-        else:
-            todos.append("- [x] **COMPLETED**: Documentation and GitOps workflow handled automatically")
-        
-        # Component-specific TODOs
-        if changes_analysis.get('resource_library_work') != 'No changes':
-            todos.append("- [ ] Test Resource Library functionality with various resource types")
-        
-        if changes_analysis.get('assignment_manager_work') != 'No changes':
-            todos.append("- [ ] Verify Assignment Manager deployment workflows")
-        
-        if changes_analysis.get('api_changes', 0) > 0:
-            todos.append("- [ ] Test API endpoints with frontend integration")
-        
-        # Standard CChorus TODOs
-        todos.extend([
-            "- [ ] Verify VS Code auto-start development servers work correctly",
-            "- [ ] Test complete Resource Library → Assignment workflow",
-            "- [ ] Check all three navigation tabs (Library, Assignments, Agents)",
-            "- [ ] Ensure agent workflow sequence is followed: Code → Documentation → GitOps"
-        ])
-        
-        return "\n".join(todos)
+        get = changes_analysis.get
+
+        # Workflow and component TODOs, then the fixed standard block
+        return "\n".join(todo for todo in (
+            ("- [x] **COMPLETED**: Documentation and GitOps workflow handled automatically"
+             if doc_agent_status else
+             "- [ ] **INFO**: /docgit workflow was auto-invoked for pending changes"),
+            "- [ ] Test Resource Library functionality with various resource types"
+            if get('resource_library_modified') else None,
+            "- [ ] Verify Assignment Manager deployment workflows"
+            if get('assignment_manager_modified') else None,
+            "- [ ] Test API endpoints with frontend integration"
+            if get('api_changes', 0) > 0 else None,
+            _STANDARD_TODOS,
+        ) if todo)
     
     def _identify_active_feature(self, changes_analysis: Dict) -> str:
         """Identify the active feature being developed."""
-        if changes_analysis.get('resource_library_work') != 'No changes':
-            return "Resource Library Enhancement"
-        elif changes_analysis.get('assignment_manager_work') != 'No changes':
-            return "Assignment Manager Development"
-        elif changes_analysis.get('component_files', 0) > 0:
-            return "UI Component Development"
-        else:
-            return "General CChorus Development"
+        return _first_match(_FEATURE_RULES, changes_analysis, "General CChorus Development")
     
     def _list_key_cchorus_files(self, changes_analysis: Dict) -> List[str]:
         """List key CChorus files that were modified."""
         key_files = []
-        
-        if changes_analysis.get('resource_library_work') != 'No changes':
+
+        if changes_analysis.get('resource_library_modified'):
             key_files.append("src/components/ResourceLibrary.tsx")
-        
-        if changes_analysis.get('assignment_manager_work') != 'No changes':
+
+        if changes_analysis.get('assignment_manager_modified'):
             key_files.append("src/components/AssignmentManager.tsx")
         
         if changes_analysis.get('api_changes', 0) > 0:
@@ -1276,11 +1491,25 @@ Check `docs/sessions/` for the latest session summary with detailed context.
         
         return key_files[:5]  # Top 5 most relevant
     
+    def _has_significant_changes(self, changes_analysis: Dict) -> bool:
+        """Check whether the session did work worth a changelog entry."""
+        return (
+            changes_analysis.get('component_files', 0) > 0 or
+            changes_analysis.get('api_changes', 0) > 0 or
+            changes_analysis.get('resource_library_modified') or
+            changes_analysis.get('assignment_manager_modified')
+        )
+
     def _update_changelog(self, session_operations: List[Dict], changes_analysis: Dict, timestamp: datetime):
         """Update CHANGELOG.md with session summary."""
         try:
+            # Skip the changelog read entirely on no-op sessions
+            if not self._has_significant_changes(changes_analysis):
+                self.log("No significant changes to add to CHANGELOG.md")
+                return
+
             changelog_path = self.project_root / "CHANGELOG.md"
-            
+
             # Read current changelog
             if changelog_path.exists():
                 with open(changelog_path, 'r') as f:
@@ -1292,33 +1521,28 @@ Check `docs/sessions/` for the latest session summary with detailed context.
             session_entry = self._generate_changelog_session_entry(
                 session_operations, changes_analysis, timestamp
             )
-            
-            # Insert after the version header
-            lines = changelog_content.split('\n')
-            insert_index = -1
-            
-            # Find the first version header (## [version])
-            for i, line in enumerate(lines):
-                if line.startswith('## [') and '] -' in line:
-                    # Insert after this line, before any ### subsections
-                    for j in range(i + 1, len(lines)):
-                        if lines[j].startswith('### ') or lines[j].startswith('## ['):
-                            insert_index = j
-                            break
-                    if insert_index == -1:
-                        insert_index = i + 1
-                    break
-            
-            if insert_index > 0 and session_entry.strip():
-                # Insert the session entry
-                lines.insert(insert_index, session_entry)
-                lines.insert(insert_index + 1, "")  # Add blank line
-                
-                # Write updated changelog
-                updated_content = '\n'.join(lines)
-                with open(changelog_path, 'w') as f:
-                    f.write(updated_content)
-                
+
+            # Find the first version header (## [version]) with one compiled
+            # regex scan instead of walking the file line by line
+            header_match = _VERSION_HEADER_RE.search(changelog_content)
+
+            if header_match and session_entry.strip():
+                # Insert after the version header, before any ### subsections
+                next_section = _SUBSECTION_RE.search(changelog_content, header_match.end())
+                if next_section:
+                    insert_pos = next_section.start()
+                    updated_content = (changelog_content[:insert_pos] +
+                                       session_entry + '\n\n' +
+                                       changelog_content[insert_pos:])
+                else:
+                    insert_pos = header_match.end()
+                    updated_content = (changelog_content[:insert_pos] +
+                                       '\n' + session_entry + '\n' +
+                                       changelog_content[insert_pos:])
+
+                # Write atomically via a temp file in the same directory
+                self._atomic_write(changelog_path, updated_content.encode())
+
                 self.log(f"Updated CHANGELOG.md with session summary")
             else:
                 self.log("No significant changes to add to CHANGELOG.md")
@@ -1327,86 +1551,67 @@ Check `docs/sessions/` for the latest session summary with detailed context.
             self.log(f"Error updating CHANGELOG.md: {e}")
     
     def _generate_changelog_session_entry(self, operations: List[Dict], changes_analysis: Dict, timestamp: datetime) -> str:
-        """Generate a changelog entry for this session."""
-        # Only create entry if there are significant changes
-        significant_changes = (
-            changes_analysis.get('component_files', 0) > 0 or
-            changes_analysis.get('api_changes', 0) > 0 or
-            changes_analysis.get('resource_library_work') != 'No changes' or
-            changes_analysis.get('assignment_manager_work') != 'No changes'
-        )
-        
-        if not significant_changes:
-            return ""
-        
-        entry_parts = []
-        date_str = timestamp.strftime('%Y-%m-%d %H:%M')
-        
-        entry_parts.append(f"### Development Session - {date_str}")
-        
-        # Add changes based on analysis
-        if changes_analysis.get('resource_library_work') != 'No changes':
-            entry_parts.append("- **Resource Library**: Enhanced functionality and user experience")
-        
-        if changes_analysis.get('assignment_manager_work') != 'No changes':
-            entry_parts.append("- **Assignment Manager**: Improved resource deployment capabilities")
-        
-        if changes_analysis.get('component_files', 0) > 0:
-            ui_components = changes_analysis.get('ui_components', [])
+        """Generate a changelog entry for this session.
+
+        Callers are expected to have checked _has_significant_changes first.
+        """
+        get = changes_analysis.get
+
+        # UI component line needs its own truncation logic
+        component_line = None
+        if get('component_files', 0) > 0:
+            ui_components = list(get('ui_components', ()))
             component_list = ', '.join(ui_components[:3])
             if len(ui_components) > 3:
                 component_list += f" and {len(ui_components) - 3} more"
-            entry_parts.append(f"- **UI Components**: Modified {component_list}")
-        
-        if changes_analysis.get('api_changes', 0) > 0:
-            entry_parts.append("- **Backend API**: Updated endpoints and functionality")
-        
-        if changes_analysis.get('agent_system_work') != 'No changes':
-            entry_parts.append("- **Agent System**: Enhanced automation and workflow capabilities")
-        
-        # Add operation summary
-        if operations:
-            tools_used = {}
-            for op in operations:
-                tool = op.get('tool', 'Unknown')
-                tools_used[tool] = tools_used.get(tool, 0) + 1
-            
-            tool_summary = []
-            if tools_used.get('Write', 0) > 0:
-                tool_summary.append(f"{tools_used['Write']} files created")
-            if tools_used.get('Edit', 0) > 0:
-                tool_summary.append(f"{tools_used['Edit']} files modified")
-            
-            if tool_summary:
-                entry_parts.append(f"- **Session Metrics**: {', '.join(tool_summary)}, {len(operations)} total operations")
-        
-        return '\n'.join(entry_parts) if len(entry_parts) > 1 else ""
+            component_line = f"- **UI Components**: Modified {component_list}"
+
+        # Operation summary; skipped when no files were created or modified
+        metrics_line = None
+        tools_used = self._tools_used
+        if operations and (tools_used['Write'] or tools_used['Edit']):
+            tool_summary = ', '.join(s for s in (
+                f"{tools_used['Write']} files created" if tools_used['Write'] else None,
+                f"{tools_used['Edit']} files modified" if tools_used['Edit'] else None,
+            ) if s)
+            metrics_line = f"- **Session Metrics**: {tool_summary}, {len(operations)} total operations"
+
+        body = '\n'.join(part for part in (
+            "- **Resource Library**: Enhanced functionality and user experience"
+            if get('resource_library_modified') else None,
+            "- **Assignment Manager**: Improved resource deployment capabilities"
+            if get('assignment_manager_modified') else None,
+            component_line,
+            "- **Backend API**: Updated endpoints and functionality"
+            if get('api_changes', 0) > 0 else None,
+            "- **Agent System**: Enhanced automation and workflow capabilities"
+            if get('agent_system_modified') else None,
+            metrics_line,
+        ) if part)
+
+        if not body:
+            return ""
+
+        return f"### Development Session - {timestamp.strftime('%Y-%m-%d %H:%M')}\n{body}"
     
     def _format_ui_compliance_details(self, ui_compliance_status: dict) -> str:
         """Format UI compliance details for session documentation."""
-        details = []
-        
         violations = ui_compliance_status.get('violations', [])
         warnings = ui_compliance_status.get('warnings', [])
-        
-        if violations:
-            details.append("### ⚠️ Issues Noted (Pre-commit hook will prevent future violations)")
-            for violation in violations:
-                details.append(f"- {violation}")
-            details.append("")
-        
-        if warnings:
-            details.append("### ⚠️ Warnings (Review Recommended)")
-            for warning in warnings:
-                details.append(f"- {warning}")
-            details.append("")
-        
+
         if not violations and not warnings:
-            details.append("### ✅ All UI compliance checks passed")
-            details.append("- No prohibited imports detected")
-            details.append("- shadcn/ui patterns followed correctly")
-        
-        return '\n'.join(details)
+            return ("### ✅ All UI compliance checks passed\n"
+                    "- No prohibited imports detected\n"
+                    "- shadcn/ui patterns followed correctly")
+
+        return '\n'.join(block for block in (
+            '\n'.join(("### ⚠️ Issues Noted (Pre-commit hook will prevent future violations)",
+                       *(f"- {violation}" for violation in violations), ""))
+            if violations else None,
+            '\n'.join(("### ⚠️ Warnings (Review Recommended)",
+                       *(f"- {warning}" for warning in warnings), ""))
+            if warnings else None,
+        ) if block)
     
     def _handle_file_watcher_shutdown(self) -> None:
         """Optionally stop file watcher on session end based on environment variable."""
@@ -1422,15 +1627,14 @@ Check `docs/sessions/` for the latest session summary with detailed context.
             stop_script = self.project_root / ".claude" / "stop-file-watcher.sh"
             if stop_script.exists():
                 self.log("Stopping file watcher...")
-                result = subprocess.run([str(stop_script)], 
-                                      capture_output=True, 
-                                      text=True, 
+                result = subprocess.run([str(stop_script)],
+                                      capture_output=True,
                                       timeout=10)
-                
+
                 if result.returncode == 0:
                     self.log("File watcher stopped successfully")
                 else:
-                    self.log(f"File watcher stop script failed: {result.stderr}")
+                    self.log(f"File watcher stop script failed: {result.stderr.decode('utf-8', 'replace')}")
             else:
                 self.log("File watcher stop script not found")
                 
@@ -1441,7 +1645,7 @@ def main():
     """Main entry point for CChorus pre-compact hook."""
     try:
         # Read input from Claude Code
-        input_data = json.load(sys.stdin)
+        input_data = _loads(sys.stdin.buffer.read())
         
         # Process with CChorus-specific hook
         hook = CChorusPreCompactHook()
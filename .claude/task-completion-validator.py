@@ -5,6 +5,7 @@ Automatically validates that tasks meet completion requirements before they can
 """
 
 import os
+import re
 import sys
 import json
 import subprocess
@@ -13,18 +14,117 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+# orjson serializes and parses in C several times faster than stdlib json;
+# fall back to the stdlib so the validator runs without the dependency.
+try:
+    import orjson
+
+    def _loads(data):
+        return orjson.loads(data)
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    def _loads(data):
+        return json.loads(data)
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode()
+
+# Documentation filenames mentioned in commit subjects, as one alternation
+# instead of a per-file substring loop over every commit
+_DOC_FILE_RE = re.compile(r"readme|claude\.md|changelog|backlog|process", re.IGNORECASE)
+
+# Each check's commit-keyword scan as one bit in a per-commit mask: commits
+# are tagged once per validation run with a handful of C-level regex
+# searches instead of every check re-scanning with Python `in` loops.
+# Relative cost of each check, used to order fail-fast runs so a doomed
+# task fails on a cheap commit scan before the expensive forks run
+_CHECK_COSTS = {
+    "playwright_testing": 1,    # walks the file index
+    "theme_testing": 1,
+    "testing_completed": 1,
+    "shadcn_ui_compliance": 2,  # forks the pre-commit hook
+}
+
+_TAG_BITS: Dict[str, int] = {}
+_TAG_PATTERNS: List[Tuple[int, "re.Pattern"]] = []
+for _i, (_name, _keywords) in enumerate([
+    ("playwright", r"test|playwright|spec"),
+    ("approval", r"screenshot|demo|user|approval|tested"),
+    ("theme", r"theme|dark|light|color"),
+    ("a11y", r"accessibility|a11y|aria|keyboard|screen reader"),
+    ("docs", r"docs|documentation|readme|changelog"),
+    ("testing", r"test|spec|coverage"),
+    ("breaking", r"breaking|major|remove|delete"),
+]):
+    _TAG_BITS[_name] = 1 << _i
+    _TAG_PATTERNS.append((1 << _i, re.compile(_keywords)))
+
 class CChorusTaskValidator:
+    # Parsed requirements config shared across instances, keyed by
+    # (path, mtime_ns): repeated validator constructions in one process
+    # skip the JSON parse, and an edited config invalidates itself.
+    _REQ_CACHE: Dict[Tuple[str, int], Dict] = {}
+
     def __init__(self, project_root: Path):
         self.project_root = project_root
-        self.validation_log_path = project_root / ".claude" / "task-validation-log.json"
+        self.validation_log_path = project_root / ".claude" / "task-validation-log.jsonl"
         self.requirements_config_path = project_root / ".claude" / "task-requirements.json"
         
         # Ensure .claude directory exists
         (project_root / ".claude").mkdir(exist_ok=True)
+
+        # Recent-commit lists keyed by hours window: the checks between them
+        # fork `git log` up to 9 times per validation for the same data
+        self._commit_cache: Dict[int, List[str]] = {}
+        self._loaded_commits: Optional[List[Tuple[int, str, str]]] = None
+        self._tagged_cache: Dict[int, List[Tuple[str, int]]] = {}
+        self._file_index: Optional[Dict[str, List[str]]] = None
+        self.file_index_cache_path = project_root / ".claude" / ".file-index-cache.json"
+        self._shadcn_cache: Optional[Dict] = None
+        self._last_log_hash: Optional[int] = None
+
+        # package.json only informs a substring test; read it once here
+        # instead of per accessibility check
+        package_json = project_root / "package.json"
+        self._has_radix = "@radix-ui" in package_json.read_text() if package_json.exists() else None
         
         # Load or create requirements configuration
         self.requirements = self._load_or_create_requirements()
-        
+
+        # One compiled alternation with a named group per category: a single
+        # C-level scan categorizes a task instead of ~25 Python substring
+        # checks, and the matched group name is the category.
+        self._category_re = re.compile("|".join(
+            f"(?P<{category}>{'|'.join(re.escape(p) for p in config['patterns'] if p != '*')})"
+            for category, config in self.requirements.items()
+            if category != "general_tasks" and config.get("patterns")
+        ), re.IGNORECASE)
+
+        # Required checks per category as interned tuples: the hot
+        # validation path reads these instead of chasing nested dicts
+        self._required_checks: Dict[str, Tuple[str, ...]] = {
+            category: tuple(config.get("required_checks", ()))
+            for category, config in self.requirements.items()
+        }
+
+        # Check dispatch table, normalized to (content, category) so
+        # _perform_validation_check is one dict lookup instead of an
+        # elif ladder over every check name
+        self._checkers = {
+            "playwright_testing": lambda content, category: self._check_playwright_testing(content),
+            "user_approval": lambda content, category: self._check_user_approval(content),
+            "shadcn_ui_compliance": lambda content, category: self._check_shadcn_ui_compliance(),
+            "theme_testing": lambda content, category: self._check_theme_testing(),
+            "accessibility_validation": lambda content, category: self._check_accessibility_validation(),
+            "documentation_manager_used": lambda content, category: self._check_documentation_manager_used(),
+            "gitops_workflow_followed": lambda content, category: self._check_gitops_workflow_followed(),
+            "testing_completed": lambda content, category: self._check_testing_completed(category),
+            "documentation_updated": lambda content, category: self._check_documentation_updated(),
+            "no_breaking_changes": lambda content, category: self._check_no_breaking_changes(),
+        }
+
         print(f"🔍 CChorus Task Completion Validator initialized")
         print(f"📁 Project: {project_root}")
     
@@ -77,20 +177,33 @@ class CChorusTaskValidator:
         
         try:
             if self.requirements_config_path.exists():
-                with open(self.requirements_config_path, 'r') as f:
-                    return json.load(f)
+                stat = self.requirements_config_path.stat()
+                cache_key = (str(self.requirements_config_path), stat.st_mtime_ns)
+                cached = self._REQ_CACHE.get(cache_key)
+                if cached is not None:
+                    return cached
+                with open(self.requirements_config_path, 'rb') as f:
+                    requirements = _loads(f.read())
+                self._REQ_CACHE[cache_key] = requirements
+                return requirements
         except Exception as e:
             print(f"⚠️  Could not load requirements config: {e}")
         
         # Save default requirements
         with open(self.requirements_config_path, 'w') as f:
-            json.dump(default_requirements, f, indent=2)
+            json.dump(default_requirements, f, indent=2)  # keep human-editable
         
         print(f"📋 Created default task requirements: {self.requirements_config_path}")
         return default_requirements
     
-    def validate_task_completion(self, task_content: str, task_priority: str = "medium") -> Dict:
-        """Validate if a task meets completion requirements."""
+    def validate_task_completion(self, task_content: str, task_priority: str = "medium",
+                                 fail_fast: bool = True) -> Dict:
+        """Validate if a task meets completion requirements.
+
+        With fail_fast (the CLI pass/fail path), checks run cheapest first
+        and stop at the first failure; pass fail_fast=False for a complete
+        report over every required check.
+        """
         validation_result = {
             "task_content": task_content,
             "task_priority": task_priority,
@@ -108,19 +221,39 @@ class CChorusTaskValidator:
             validation_result["task_category"] = task_category
             
             # Get requirements for this task category
-            requirements = self.requirements.get(task_category, self.requirements["general_tasks"])
-            required_checks = requirements["required_checks"]
+            required_checks = self._required_checks.get(
+                task_category, self._required_checks["general_tasks"])
             
             print(f"🔍 Validating task: {task_content[:50]}...")
             print(f"📋 Category: {task_category}")
             print(f"✅ Required checks: {len(required_checks)}")
             
-            # Perform validation checks
+            # Perform validation checks concurrently: they are independent
+            # and I/O-bound (git forks, pre-commit hook, file globs), so
+            # wall time drops to the slowest check instead of the sum.
+            # Warm the shared commit cache first so threads don't race to
+            # fork git log.
+            self._load_commits()
             all_passed = True
-            for check in required_checks:
-                result = self._perform_validation_check(check, task_content, task_category)
+            if fail_fast:
+                check_results = []
+                for check in sorted(required_checks, key=lambda c: _CHECK_COSTS.get(c, 0)):
+                    result = self._perform_validation_check(check, task_content, task_category)
+                    check_results.append(result)
+                    if not result["passed"]:
+                        break
+            else:
+                from concurrent.futures import ThreadPoolExecutor
+                # max(1, ...): a category may have an empty required_checks
+                # list in the user-edited config, and max_workers=0 raises
+                with ThreadPoolExecutor(max_workers=max(1, min(8, len(required_checks)))) as executor:
+                    check_results = list(executor.map(
+                        lambda check: self._perform_validation_check(check, task_content, task_category),
+                        required_checks
+                    ))
+            for result in check_results:
                 validation_result["checks_performed"].append(result)
-                
+
                 if not result["passed"]:
                     all_passed = False
                     validation_result["failures"].append(result["failure_reason"])
@@ -149,18 +282,8 @@ class CChorusTaskValidator:
     
     def _categorize_task(self, task_content: str) -> str:
         """Categorize task based on content patterns."""
-        content_lower = task_content.lower()
-        
-        # Check each category's patterns
-        for category, config in self.requirements.items():
-            if category == "general_tasks":
-                continue
-            
-            patterns = config.get("patterns", [])
-            if any(pattern in content_lower for pattern in patterns):
-                return category
-        
-        return "general_tasks"
+        match = self._category_re.search(task_content)
+        return match.lastgroup if match else "general_tasks"
     
     def _perform_validation_check(self, check_name: str, task_content: str, task_category: str) -> Dict:
         """Perform a specific validation check."""
@@ -173,30 +296,14 @@ class CChorusTaskValidator:
         }
         
         try:
-            if check_name == "playwright_testing":
-                return self._check_playwright_testing(task_content)
-            elif check_name == "user_approval":
-                return self._check_user_approval(task_content)
-            elif check_name == "shadcn_ui_compliance":
-                return self._check_shadcn_ui_compliance()
-            elif check_name == "theme_testing":
-                return self._check_theme_testing()
-            elif check_name == "accessibility_validation":
-                return self._check_accessibility_validation()
-            elif check_name == "documentation_manager_used":
-                return self._check_documentation_manager_used()
-            elif check_name == "gitops_workflow_followed":
-                return self._check_gitops_workflow_followed()
-            elif check_name == "testing_completed":
-                return self._check_testing_completed(task_category)
-            elif check_name == "documentation_updated":
-                return self._check_documentation_updated()
-            elif check_name == "no_breaking_changes":
-                return self._check_no_breaking_changes()
-            else:
-                check_result["passed"] = True
-                check_result["details"]["status"] = "Check not implemented - assumed passing"
-                
+            checker = self._checkers.get(check_name)
+            if checker is not None:
+                return checker(task_content, task_category)
+
+            check_result["passed"] = True
+            check_result["details"]["status"] = "Check not implemented - assumed passing"
+
+
         except Exception as e:
             check_result["failure_reason"] = f"Check failed with error: {e}"
             check_result["recommendation"] = "Investigate check implementation"
@@ -210,12 +317,11 @@ class CChorusTaskValidator:
         # Look for Playwright test files or mentions
         try:
             # Check for test files
-            test_files = list(self.project_root.glob("**/*test*.js")) + list(self.project_root.glob("**/*spec*.js"))
-            playwright_tests = [f for f in test_files if "playwright" in str(f).lower()]
+            playwright_tests = self._scan_project()["playwright_files"]
             
             # Check recent commits for test mentions
-            recent_commits = self._get_recent_commits(hours=24)
-            test_commits = [c for c in recent_commits if any(keyword in c.lower() for keyword in ["test", "playwright", "spec"])]
+            test_bit = _TAG_BITS["playwright"]
+            test_commits = [c for c, mask in self._tagged_commits(hours=24) if mask & test_bit]
             
             if playwright_tests or test_commits:
                 result["passed"] = True
@@ -241,10 +347,9 @@ class CChorusTaskValidator:
         
         # For now, we'll check for recent screenshots or approval mentions
         try:
-            recent_commits = self._get_recent_commits(hours=48)
+            approval_bit = _TAG_BITS["approval"]
             approval_indicators = [
-                c for c in recent_commits 
-                if any(keyword in c.lower() for keyword in ["screenshot", "demo", "user", "approval", "tested"])
+                c for c, mask in self._tagged_commits(hours=48) if mask & approval_bit
             ]
             
             if approval_indicators:
@@ -261,14 +366,28 @@ class CChorusTaskValidator:
     
     def _check_shadcn_ui_compliance(self) -> Dict:
         """Check for shadcn/ui compliance in codebase."""
+        # Forking the pre-commit hook is the heaviest check; the tree
+        # doesn't change mid-batch, so one run covers every task
+        if self._shadcn_cache is not None:
+            return self._shadcn_cache
+
         result = {"check_name": "shadcn_ui_compliance", "passed": False, "details": {}}
-        
+
         try:
+            # Stat before forking: a missing hook used to cost a bash fork
+            # just to fail, and a runaway hook could hang the validation
+            hook_path = self.project_root / ".git/hooks/pre-commit"
+            if not hook_path.exists():
+                result["failure_reason"] = "No pre-commit hook found for shadcn/ui compliance"
+                result["recommendation"] = "Install the pre-commit hook to enforce shadcn/ui usage"
+                self._shadcn_cache = result
+                return result
+
             # Run the pre-commit hook compliance check
             compliance_result = subprocess.run([
-                'bash', str(self.project_root / ".git/hooks/pre-commit")
-            ], capture_output=True, text=True, cwd=self.project_root)
-            
+                'bash', str(hook_path)
+            ], capture_output=True, text=True, cwd=self.project_root, timeout=10)
+
             if compliance_result.returncode == 0:
                 result["passed"] = True
                 result["details"]["compliance_status"] = "Pre-commit hook passed"
@@ -277,9 +396,13 @@ class CChorusTaskValidator:
                 result["recommendation"] = "Fix shadcn/ui violations and ensure compliance"
                 result["details"]["compliance_output"] = compliance_result.stderr
             
+        except subprocess.TimeoutExpired:
+            result["failure_reason"] = "Pre-commit hook timed out after 10 seconds"
+            result["recommendation"] = "Investigate the pre-commit hook script"
         except Exception as e:
             result["failure_reason"] = f"Could not check shadcn/ui compliance: {e}"
-        
+
+        self._shadcn_cache = result
         return result
     
     def _check_theme_testing(self) -> Dict:
@@ -288,14 +411,13 @@ class CChorusTaskValidator:
         
         # Check for theme-related commits or files
         try:
-            recent_commits = self._get_recent_commits(hours=48)
+            theme_bit = _TAG_BITS["theme"]
             theme_mentions = [
-                c for c in recent_commits 
-                if any(keyword in c.lower() for keyword in ["theme", "dark", "light", "color"])
+                c for c, mask in self._tagged_commits(hours=48) if mask & theme_bit
             ]
             
             # Check for theme files
-            theme_files = list(self.project_root.glob("**/theme*.tsx")) + list(self.project_root.glob("**/theme*.ts"))
+            theme_files = self._scan_project()["theme_files"]
             
             if theme_mentions or theme_files:
                 result["passed"] = True
@@ -316,10 +438,9 @@ class CChorusTaskValidator:
         
         # Check for accessibility mentions in commits or code
         try:
-            recent_commits = self._get_recent_commits(hours=48)
+            a11y_bit = _TAG_BITS["a11y"]
             a11y_mentions = [
-                c for c in recent_commits 
-                if any(keyword in c.lower() for keyword in ["accessibility", "a11y", "aria", "keyboard", "screen reader"])
+                c for c, mask in self._tagged_commits(hours=48) if mask & a11y_bit
             ]
             
             if a11y_mentions:
@@ -327,16 +448,12 @@ class CChorusTaskValidator:
                 result["details"]["a11y_commits"] = len(a11y_mentions)
             else:
                 # Check if using Radix UI (which provides accessibility)
-                package_json = self.project_root / "package.json"
-                if package_json.exists():
-                    with open(package_json) as f:
-                        content = f.read()
-                        if "@radix-ui" in content:
-                            result["passed"] = True
-                            result["details"]["accessibility_source"] = "Radix UI provides accessibility features"
-                        else:
-                            result["failure_reason"] = "No accessibility validation evidence found"
-                            result["recommendation"] = "Test keyboard navigation and screen reader compatibility"
+                if self._has_radix:
+                    result["passed"] = True
+                    result["details"]["accessibility_source"] = "Radix UI provides accessibility features"
+                elif self._has_radix is not None:
+                    result["failure_reason"] = "No accessibility validation evidence found"
+                    result["recommendation"] = "Test keyboard navigation and screen reader compatibility"
                 else:
                     result["failure_reason"] = "Could not verify accessibility validation"
             
@@ -353,16 +470,15 @@ class CChorusTaskValidator:
             # Check for documentation trigger files
             trigger_files = [
                 self.project_root / ".claude" / "doc-update-needed.trigger",
-                self.project_root / ".claude" / "pending-agent-invocations.json"
+                self.project_root / ".claude" / "pending-agent-invocations.jsonl"
             ]
             
             doc_triggers_found = any(f.exists() for f in trigger_files)
             
             # Check recent commits for documentation updates
-            recent_commits = self._get_recent_commits(hours=48)
+            doc_bit = _TAG_BITS["docs"]
             doc_commits = [
-                c for c in recent_commits 
-                if any(keyword in c.lower() for keyword in ["docs", "documentation", "readme", "changelog"])
+                c for c, mask in self._tagged_commits(hours=48) if mask & doc_bit
             ]
             
             if doc_triggers_found or doc_commits:
@@ -384,7 +500,7 @@ class CChorusTaskValidator:
         
         try:
             # Check for GitOps agent invocations
-            gitops_invocations = self.project_root / ".claude" / "pending-agent-invocations.json"
+            gitops_invocations = self.project_root / ".claude" / "pending-agent-invocations.jsonl"
             
             # Check recent commits for GitOps workflow patterns
             recent_commits = self._get_recent_commits(hours=48)
@@ -411,13 +527,12 @@ class CChorusTaskValidator:
         
         try:
             # Check for test files
-            test_files = list(self.project_root.glob("**/*test*")) + list(self.project_root.glob("**/*spec*"))
+            test_files = self._scan_project()["test_files"]
             
             # Check for recent test-related commits
-            recent_commits = self._get_recent_commits(hours=48)
+            testing_bit = _TAG_BITS["testing"]
             test_commits = [
-                c for c in recent_commits 
-                if any(keyword in c.lower() for keyword in ["test", "spec", "coverage"])
+                c for c, mask in self._tagged_commits(hours=48) if mask & testing_bit
             ]
             
             if test_files or test_commits:
@@ -439,17 +554,12 @@ class CChorusTaskValidator:
         
         try:
             # Check for recent documentation file changes
-            doc_files = [
-                "README.md", "CLAUDE.md", "CHANGELOG.md", "BACKLOG.md", "PROCESS.md"
+            cutoff = time.time() - 48 * 3600
+            doc_updates = [
+                subject for ts, subject, lower in self._load_commits()
+                if ts >= cutoff and _DOC_FILE_RE.search(lower)
             ]
             
-            recent_commits = self._get_recent_commits(hours=48)
-            doc_updates = []
-            
-            for commit in recent_commits:
-                if any(doc_file.lower() in commit.lower() for doc_file in doc_files):
-                    doc_updates.append(commit)
-            
             if doc_updates:
                 result["passed"] = True
                 result["details"]["doc_update_commits"] = len(doc_updates)
@@ -468,10 +578,9 @@ class CChorusTaskValidator:
         
         try:
             # Check recent commits for breaking change indicators
-            recent_commits = self._get_recent_commits(hours=48)
+            breaking_bit = _TAG_BITS["breaking"]
             breaking_indicators = [
-                c for c in recent_commits 
-                if any(keyword in c.lower() for keyword in ["breaking", "major", "remove", "delete"])
+                c for c, mask in self._tagged_commits(hours=48) if mask & breaking_bit
             ]
             
             if breaking_indicators:
@@ -488,21 +597,126 @@ class CChorusTaskValidator:
         
         return result
     
-    def _get_recent_commits(self, hours: int = 24) -> List[str]:
-        """Get recent commit messages within specified hours."""
+    def _load_commits(self, max_hours: int = 48) -> List[Tuple[int, str, str]]:
+        """Load (unix timestamp, subject, lowered subject) for the widest window once."""
+        if self._loaded_commits is not None:
+            return self._loaded_commits
+
         try:
-            result = subprocess.run([
-                'git', 'log', f'--since={hours} hours ago', '--pretty=format:%s'
-            ], capture_output=True, text=True, cwd=self.project_root)
-            
-            if result.returncode == 0 and result.stdout.strip():
-                return result.stdout.strip().split('\n')
-            
-            return []
-            
+            # Stream stdout line by line: the tuples are built as git
+            # produces them, never holding the whole log as one string
+            # plus a parallel list
+            proc = subprocess.Popen([
+                'git', 'log', f'--since={max_hours} hours ago', '--pretty=format:%ct%x09%s'
+            ], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+               text=True, cwd=self.project_root)
+
+            commits = []
+            for line in proc.stdout:
+                line = line.rstrip('\n')
+                if not line:
+                    continue
+                ts, _, subject = line.partition('\t')
+                # Lower once here: the keyword checks otherwise re-lower
+                # every subject several times per validation
+                commits.append((int(ts), subject, subject.lower()))
+
+            proc.stdout.close()
+            proc.wait()
+
+            self._loaded_commits = commits
+            return commits
+
         except Exception as e:
             print(f"⚠️  Could not get recent commits: {e}")
             return []
+
+    def _scan_project(self) -> Dict[str, List[str]]:
+        """Walk the tree once and index the files the checks look for."""
+        if self._file_index is not None:
+            return self._file_index
+
+        # The index only changes with the tree, so key a persisted copy on
+        # HEAD: back-to-back validations load one small JSON instead of
+        # re-walking the project.
+        head = None
+        try:
+            head_result = subprocess.run([
+                'git', 'rev-parse', 'HEAD'
+            ], capture_output=True, text=True, cwd=self.project_root)
+            if head_result.returncode == 0:
+                head = head_result.stdout.strip()
+        except Exception:
+            pass
+
+        if head:
+            try:
+                with open(self.file_index_cache_path, 'rb') as f:
+                    cached = _loads(f.read())
+                if cached.get("head") == head:
+                    self._file_index = cached["index"]
+                    return self._file_index
+            except (FileNotFoundError, ValueError, KeyError):
+                pass
+
+        index = {"test_files": [], "playwright_files": [], "theme_files": []}
+        for dirpath, dirs, files in os.walk(self.project_root):
+            # Prune the heavy trees the recursive globs used to descend into
+            dirs[:] = [d for d in dirs if d not in ('node_modules', '.git', 'dist', '.venv')]
+            for name in files:
+                lower = name.lower()
+                if 'test' in lower or 'spec' in lower:
+                    path = os.path.join(dirpath, name)
+                    index["test_files"].append(path)
+                    if lower.endswith('.js') and 'playwright' in path.lower():
+                        index["playwright_files"].append(path)
+                if lower.startswith('theme') and lower.endswith(('.tsx', '.ts')):
+                    index["theme_files"].append(os.path.join(dirpath, name))
+
+        self._file_index = index
+
+        if head:
+            try:
+                tmp = self.file_index_cache_path.with_suffix('.json.tmp')
+                with open(tmp, 'wb') as f:
+                    f.write(_dumps({"head": head, "index": index}))
+                os.replace(tmp, self.file_index_cache_path)
+            except Exception as e:
+                print(f"⚠️  Could not save file index cache: {e}")
+
+        return index
+
+    def _tagged_commits(self, hours: int = 48) -> List[Tuple[str, int]]:
+        """Get recent commits paired with their keyword-category bitmask."""
+        cached = self._tagged_cache.get(hours)
+        if cached is not None:
+            return cached
+
+        cutoff = time.time() - hours * 3600
+        tagged = []
+        for ts, subject, lower in self._load_commits():
+            if ts < cutoff:
+                continue
+            mask = 0
+            for bit, pattern in _TAG_PATTERNS:
+                if pattern.search(lower):
+                    mask |= bit
+            tagged.append((subject, mask))
+
+        self._tagged_cache[hours] = tagged
+        return tagged
+
+    def _get_recent_commits(self, hours: int = 24) -> List[str]:
+        """Get recent commit messages within specified hours."""
+        cached = self._commit_cache.get(hours)
+        if cached is not None:
+            return cached
+
+        # One wide git log fork; narrower windows filter in memory
+        cutoff = time.time() - hours * 3600
+        commits = [subject for ts, subject, _ in self._load_commits() if ts >= cutoff]
+        self._commit_cache[hours] = commits
+        return commits
     
     def _log_validation_result(self, validation_result: Dict):
         """Log validation result for historical tracking."""
@@ -516,27 +730,37 @@ class CChorusTaskValidator:
                 "failures_count": len(validation_result["failures"])
             }
             
-            # Load existing log
-            validation_log = []
-            if self.validation_log_path.exists():
-                try:
-                    with open(self.validation_log_path, 'r') as f:
-                        validation_log = json.load(f)
-                except:
-                    validation_log = []
-            
-            # Add new entry
-            validation_log.append(log_entry)
-            
-            # Keep only last 100 entries
-            validation_log = validation_log[-100:]
-            
-            # Save updated log
-            with open(self.validation_log_path, 'w') as f:
-                json.dump(validation_log, f, indent=2)
-            
+            # Iterating --validate-task on the same task produces identical
+            # entries back to back; hash-compare and skip the rewrite
+            entry_hash = hash((log_entry["task"], log_entry["result"]))
+            if entry_hash == self._last_log_hash:
+                return
+            self._last_log_hash = entry_hash
+
+            # JSON Lines log: one append per validation instead of
+            # rereading and rewriting the whole history array
+            with open(self.validation_log_path, 'ab') as f:
+                f.write(_dumps(log_entry) + b'\n')
+
+            self._compact_log()
+
         except Exception as e:
             print(f"⚠️  Could not log validation result: {e}")
+
+    def _compact_log(self):
+        """Trim the validation log to its last 100 entries once it grows past 200."""
+        # Size gate first so the common case never re-reads the log
+        if self.validation_log_path.stat().st_size <= 16384:
+            return
+
+        with open(self.validation_log_path, 'rb') as f:
+            lines = f.readlines()
+
+        if len(lines) > 200:
+            tmp = self.validation_log_path.with_suffix('.jsonl.tmp')
+            with open(tmp, 'wb') as f:
+                f.writelines(lines[-100:])
+            os.replace(tmp, self.validation_log_path)
     
     def validate_current_todos(self) -> Dict:
         """Validate all current todos that are marked as completed."""
@@ -352,10 +352,16 @@ async function updateInfrastructureStatus() {
     dashboardState.infrastructure.backendServer = backendRunning ? 'running' : 'stopped';
 }
 
+// The .claude queues and logs are JSON Lines (one object per line, append-only)
+function readLastJsonLine(filePath) {
+    const lines = fs.readFileSync(filePath, 'utf8').split('\n').filter(line => line.trim());
+    return lines.length > 0 ? JSON.parse(lines[lines.length - 1]) : null;
+}
+
 function watchFileChanges() {
     const triggerFile = path.join(PROJECT_ROOT, '.claude', 'doc-update-needed.trigger');
-    const pendingFile = path.join(PROJECT_ROOT, '.claude', 'pending-agent-invocations.json');
-    const syncLogFile = path.join(PROJECT_ROOT, '.claude', 'sync-command-log.json');
+    const pendingFile = path.join(PROJECT_ROOT, '.claude', 'pending-agent-invocations.jsonl');
+    const syncLogFile = path.join(PROJECT_ROOT, '.claude', 'sync-command-log.jsonl');
     const githubLogFile = path.join(PROJECT_ROOT, '.claude', 'github-sync-log.json');
     
     // Watch trigger file for changes
@@ -403,10 +409,9 @@ function watchFileChanges() {
         fs.watchFile(pendingFile, (curr, prev) => {
             if (curr.mtime > prev.mtime) {
                 try {
-                    const pending = JSON.parse(fs.readFileSync(pendingFile, 'utf8'));
-                    if (pending.length > 0) {
-                        const latest = pending[pending.length - 1];
-                        addActivity(latest.agent, 
+                    const latest = readLastJsonLine(pendingFile);
+                    if (latest) {
+                        addActivity(latest.agent,
                             `${latest.trigger}: ${latest.prompt.substring(0, 100)}...`,
                             latest.files_changed || []
                         );
@@ -423,11 +428,10 @@ function watchFileChanges() {
         fs.watchFile(syncLogFile, (curr, prev) => {
             if (curr.mtime > prev.mtime) {
                 try {
-                    const logs = JSON.parse(fs.readFileSync(syncLogFile, 'utf8'));
-                    if (logs.length > 0) {
-                        const latest = logs[logs.length - 1];
+                    const latest = readLastJsonLine(syncLogFile);
+                    if (latest) {
                         const agentsList = latest.agents_invoked ? latest.agents_invoked.join(', ') : 'none';
-                        addActivity('sync-command', 
+                        addActivity('sync-command',
                             `Processed ${latest.changes_processed} changes, invoked: ${agentsList}`,
                             []
                         );
@@ -880,16 +884,15 @@ function watchCompactTracking() {
 
 function watchForAgentInvocations() {
     // Watch for pending agent invocations to track token usage
-    const pendingFile = path.join(PROJECT_ROOT, '.claude', 'pending-agent-invocations.json');
+    const pendingFile = path.join(PROJECT_ROOT, '.claude', 'pending-agent-invocations.jsonl');
     
     if (fs.existsSync(pendingFile)) {
         fs.watchFile(pendingFile, async (curr, prev) => {
             if (curr.mtime > prev.mtime) {
                 try {
-                    const pending = JSON.parse(fs.readFileSync(pendingFile, 'utf8'));
-                    if (pending.length > 0) {
-                        const latest = pending[pending.length - 1];
-                        
+                    const latest = readLastJsonLine(pendingFile);
+                    if (latest) {
+
                         // Estimate tokens based on agent type
                         const tokenEstimates = {
                             'readme-updater': 1500,